@@ -8,6 +8,7 @@ This is a meta-team that orchestrates between:
 The team automatically routes queries to the most appropriate specialized team.
 """
 
+from functools import lru_cache
 from typing import List
 from agno.team import Team
 
@@ -16,6 +17,7 @@ from agents.investment_team import get_teams as get_investment_teams
 from core.llm import get_llm
 
 
+@lru_cache(maxsize=1)
 def get_teams() -> List[Team]:
     """
     Create and return the unified Financial Advisor Team.
@@ -24,12 +26,16 @@ def get_teams() -> List[Team]:
     - Personal Finance Team
     - Investment Helper Team
 
+    Built once per process and cached, like the specialized teams.
+
     Returns:
         List containing the unified Financial Advisor Team
     """
-    # Get the specialized teams
-    personal_finance_teams = get_personal_finance_teams()
-    investment_teams = get_investment_teams()
+    # Build separate instances of the specialized teams: agno records the
+    # parent team on its members, so the cached standalone teams registered
+    # with AgentOS must not be shared with this meta-team
+    personal_finance_teams = get_personal_finance_teams.__wrapped__()
+    investment_teams = get_investment_teams.__wrapped__()
 
     # Create the unified team with both specialized teams as members
     financial_advisor_team = Team(
@@ -128,3 +134,8 @@ def get_financial_advisor_team() -> Team:
     """
     teams = get_teams()
     return teams[0]
+
+
+def reset_teams() -> None:
+    """Drop the cached Financial Advisor Team so the next get_teams() call rebuilds it."""
+    get_teams.cache_clear()
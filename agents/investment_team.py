@@ -7,12 +7,19 @@ Agents (Consolidated from 5 to 3 for efficiency):
 3. Portfolio Manager - Portfolio Analysis, Allocation & Rebalancing
 """
 
-from typing import Any, Dict, List
-from agno.agent import Agent
-from agno.team import Team
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Final, List
 from agno.tools import tool
-from agno.tools.serper import SerperTools
+from core.limits import upstream_limit
 from core.llm import get_llm
+from core.tools import prepare_tools
+
+# Agent and Team are only needed to build the team, so they are imported in
+# the factories below; the tools import without them.
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.team import Team
 
 
 # =============================================================================
@@ -30,6 +37,63 @@ REBALANCING_THRESHOLD = 5
 MIN_EQUITY_PERCENTAGE = 20
 MAX_EQUITY_PERCENTAGE = 80
 
+# Capital gains holding periods (days) and annual equity LTCG exemption (INR)
+EQUITY_LTCG_THRESHOLD_DAYS = 365
+DEBT_LTCG_THRESHOLD_DAYS = 1095  # 36 months = 3 years
+EQUITY_LTCG_EXEMPTION = 125000  # ₹1.25 lakh
+
+# Capital gains tax rates (%). LTCG is 12.5% for equity (above the exemption)
+# and for debt (no indexation); debt STCG is taxed at the slab rate, assumed
+# to be the highest slab plus cess.
+EQUITY_STCG_RATE = 20
+LTCG_RATE = 12.5
+DEBT_STCG_ASSUMED_SLAB_RATE = 30
+INCOME_TAX_CESS_RATE = 4
+
+# Periods accepted by yfinance for price history
+VALID_HISTORY_PERIODS = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "max"]
+
+# Display names for index symbols, and the indices each market overview covers
+INDEX_NAMES = {
+    "^NSEI": "Nifty 50",
+    "^BSESN": "BSE Sensex",
+    "^GSPC": "S&P 500",
+    "^IXIC": "Nasdaq Composite",
+    "^DJI": "Dow Jones Industrial Average",
+}
+
+INDIAN_MARKET_INDICES = {
+    "^NSEI": "Nifty 50",
+    "^BSESN": "Sensex",
+    "^NSEBANK": "Nifty Bank",
+    "^CNXIT": "Nifty IT",
+    "^CRSLDX": "Nifty 500",
+    "^CNXAUTO": "Nifty Auto",
+    "^CNXPHARMA": "Nifty Pharma",
+    "^CNXFMCG": "Nifty FMCG",
+}
+
+GLOBAL_MARKET_INDICES = {
+    # US Markets
+    "^GSPC": "S&P 500 (US)",
+    "^IXIC": "Nasdaq (US)",
+    "^DJI": "Dow Jones (US)",
+    # India
+    "^NSEI": "Nifty 50 (India)",
+    "^BSESN": "Sensex (India)",
+    # UK
+    "^FTSE": "FTSE 100 (UK)",
+    # Japan
+    "^N225": "Nikkei 225 (Japan)",
+    # China
+    "000001.SS": "Shanghai Composite (China)",
+    "^HSI": "Hang Seng (HK)",
+}
+
+# Accepted choices for age-based asset allocation
+VALID_RISK_LEVELS = ["conservative", "moderate", "aggressive"]
+VALID_ALLOCATION_RULES = ["100", "110", "120", "auto"]
+
 
 # =============================================================================
 # CUSTOM TOOLS FOR INVESTMENT TEAM
@@ -54,7 +118,8 @@ def get_stock_metrics(symbol: str) -> Dict[str, Any]:
         import yfinance as yf
 
         stock = yf.Ticker(symbol.strip().upper())
-        info = stock.info
+        with upstream_limit("yfinance"):
+            info = stock.info
 
         # Check if valid data was returned
         if not info or "symbol" not in info and "longName" not in info:
@@ -88,6 +153,26 @@ def get_stock_metrics(symbol: str) -> Dict[str, Any]:
         return {"error": f"Failed to fetch stock data: {str(e)}", "symbol": symbol}
 
 
+def _summarize_history(symbol: str, period: str, hist: Any) -> Dict[str, Any]:
+    """Summarize an OHLCV price DataFrame into period return and range stats."""
+    start_price = float(hist["Close"].iloc[0])
+    end_price = float(hist["Close"].iloc[-1])
+    period_return = ((end_price - start_price) / start_price) * 100
+
+    return {
+        "symbol": symbol,
+        "period": period,
+        "start_date": str(hist.index[0].date()),
+        "end_date": str(hist.index[-1].date()),
+        "start_price": round(start_price, 2),
+        "end_price": round(end_price, 2),
+        "high": round(float(hist["High"].max()), 2),
+        "low": round(float(hist["Low"].min()), 2),
+        "avg_volume": int(hist["Volume"].mean()),
+        "period_return_pct": round(period_return, 2),
+    }
+
+
 @tool
 def get_stock_history(symbol: str, period: str = "1mo") -> Dict[str, Any]:
     """
@@ -100,10 +185,9 @@ def get_stock_history(symbol: str, period: str = "1mo") -> Dict[str, Any]:
     Returns:
         Dictionary with historical price data
     """
-    valid_periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "max"]
-    if period not in valid_periods:
+    if period not in VALID_HISTORY_PERIODS:
         return {
-            "error": f"Invalid period '{period}'. Must be one of: {', '.join(valid_periods)}",
+            "error": f"Invalid period '{period}'. Must be one of: {', '.join(VALID_HISTORY_PERIODS)}",
             "symbol": symbol,
         }
 
@@ -114,34 +198,79 @@ def get_stock_history(symbol: str, period: str = "1mo") -> Dict[str, Any]:
         import yfinance as yf
 
         stock = yf.Ticker(symbol.strip().upper())
-        hist = stock.history(period=period)
+        with upstream_limit("yfinance"):
+            hist = stock.history(period=period)
 
         if hist.empty:
             return {"error": f"No historical data found for {symbol}", "symbol": symbol}
 
-        # Calculate returns
-        start_price = float(hist["Close"].iloc[0])
-        end_price = float(hist["Close"].iloc[-1])
-        period_return = ((end_price - start_price) / start_price) * 100
+        return _summarize_history(symbol, period, hist)
+    except ImportError:
+        return {
+            "error": "yfinance package not installed. Install with: pip install yfinance"
+        }
+    except Exception as e:
+        return {"error": f"Failed to fetch historical data: {str(e)}", "symbol": symbol}
+
 
+@tool
+def get_stock_history_batch(symbols: List[str], period: str = "1mo") -> Dict[str, Any]:
+    """
+    Fetch historical data for several stocks in one request.
+
+    Prefer this over repeated get_stock_history calls when reviewing multiple
+    holdings.
+
+    Args:
+        symbols: Stock ticker symbols (e.g. ['RELIANCE.NS', 'TCS.NS', 'INFY.NS'])
+        period: Time period - '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max'
+
+    Returns:
+        Dictionary with per-symbol historical price data (same fields as
+        get_stock_history), keyed by symbol
+    """
+    if period not in VALID_HISTORY_PERIODS:
         return {
-            "symbol": symbol,
-            "period": period,
-            "start_date": str(hist.index[0].date()),
-            "end_date": str(hist.index[-1].date()),
-            "start_price": round(start_price, 2),
-            "end_price": round(end_price, 2),
-            "high": round(float(hist["High"].max()), 2),
-            "low": round(float(hist["Low"].min()), 2),
-            "avg_volume": int(hist["Volume"].mean()),
-            "period_return_pct": round(period_return, 2),
+            "error": f"Invalid period '{period}'. Must be one of: {', '.join(VALID_HISTORY_PERIODS)}"
         }
+
+    tickers = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+    if not tickers:
+        return {"error": "At least one stock symbol is required"}
+
+    try:
+        import yfinance as yf
+
+        with upstream_limit("yfinance"):
+            data = yf.download(
+                tickers=" ".join(tickers),
+                period=period,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                auto_adjust=True,
+            )
+
+        results: Dict[str, Any] = {}
+        for ticker in tickers:
+            if ticker not in data.columns.get_level_values(0):
+                results[ticker] = {"error": f"No historical data found for {ticker}"}
+                continue
+
+            hist = data[ticker].dropna(how="all")
+            if hist.empty:
+                results[ticker] = {"error": f"No historical data found for {ticker}"}
+                continue
+
+            results[ticker] = _summarize_history(ticker, period, hist)
+
+        return {"period": period, "stocks": results}
     except ImportError:
         return {
             "error": "yfinance package not installed. Install with: pip install yfinance"
         }
     except Exception as e:
-        return {"error": f"Failed to fetch historical data: {str(e)}", "symbol": symbol}
+        return {"error": f"Failed to fetch historical data: {str(e)}"}
 
 
 @tool
@@ -162,17 +291,10 @@ def get_index_data(index_symbol: str) -> Dict[str, Any]:
     try:
         import yfinance as yf
 
-        index_names = {
-            "^NSEI": "Nifty 50",
-            "^BSESN": "BSE Sensex",
-            "^GSPC": "S&P 500",
-            "^IXIC": "Nasdaq Composite",
-            "^DJI": "Dow Jones Industrial Average",
-        }
-
         index = yf.Ticker(index_symbol)
-        info = index.info
-        hist = index.history(period="5d")
+        with upstream_limit("yfinance"):
+            info = index.info
+            hist = index.history(period="5d")
 
         if not hist.empty:
             current = float(hist["Close"].iloc[-1])
@@ -186,7 +308,7 @@ def get_index_data(index_symbol: str) -> Dict[str, Any]:
 
         return {
             "symbol": index_symbol,
-            "name": index_names.get(index_symbol, info.get("shortName", "N/A")),
+            "name": INDEX_NAMES.get(index_symbol, info.get("shortName", "N/A")),
             "current_value": (
                 round(current, 2) if isinstance(current, (int, float)) else current
             ),
@@ -228,7 +350,8 @@ def _fetch_index_performance(
         import yfinance as yf
 
         index = yf.Ticker(symbol)
-        hist = index.history(period=period)
+        with upstream_limit("yfinance"):
+            hist = index.history(period=period)
 
         if not hist.empty and len(hist) > 0:
             current = float(hist["Close"].iloc[-1])
@@ -256,20 +379,9 @@ def get_indian_market_overview() -> Dict[str, Any]:
     try:
         import yfinance as yf
 
-        indices = {
-            "^NSEI": "Nifty 50",
-            "^BSESN": "Sensex",
-            "^NSEBANK": "Nifty Bank",
-            "^CNXIT": "Nifty IT",
-            "^CRSLDX": "Nifty 500",
-            "^CNXAUTO": "Nifty Auto",
-            "^CNXPHARMA": "Nifty Pharma",
-            "^CNXFMCG": "Nifty FMCG",
-        }
-
         result = {"indices": {}}
 
-        for symbol, name in indices.items():
+        for symbol, name in INDIAN_MARKET_INDICES.items():
             result["indices"][name] = _fetch_index_performance(symbol, name, "7d")
 
         return result
@@ -292,26 +404,9 @@ def get_global_market_overview() -> Dict[str, Any]:
     try:
         import yfinance as yf
 
-        indices = {
-            # US Markets
-            "^GSPC": "S&P 500 (US)",
-            "^IXIC": "Nasdaq (US)",
-            "^DJI": "Dow Jones (US)",
-            # India
-            "^NSEI": "Nifty 50 (India)",
-            "^BSESN": "Sensex (India)",
-            # UK
-            "^FTSE": "FTSE 100 (UK)",
-            # Japan
-            "^N225": "Nikkei 225 (Japan)",
-            # China
-            "000001.SS": "Shanghai Composite (China)",
-            "^HSI": "Hang Seng (HK)",
-        }
-
         result = {"indices": {}}
 
-        for symbol, name in indices.items():
+        for symbol, name in GLOBAL_MARKET_INDICES.items():
             result["indices"][name] = _fetch_index_performance(symbol, name, "5d")
 
         return result
@@ -335,7 +430,6 @@ def analyze_portfolio_allocation(holdings: str) -> Dict[str, Any]:
         Dictionary with portfolio analysis
     """
     try:
-        import json
         import yfinance as yf
 
         holdings_list = json.loads(holdings)
@@ -465,16 +559,14 @@ def calculate_age_based_allocation(
     if not isinstance(age, int) or age < 18 or age > 100:
         return {"error": "Age must be an integer between 18 and 100"}
 
-    valid_risk_levels = ["conservative", "moderate", "aggressive"]
-    if risk_tolerance.lower() not in valid_risk_levels:
+    if risk_tolerance.lower() not in VALID_RISK_LEVELS:
         return {
-            "error": f"Invalid risk tolerance. Must be one of: {', '.join(valid_risk_levels)}"
+            "error": f"Invalid risk tolerance. Must be one of: {', '.join(VALID_RISK_LEVELS)}"
         }
 
-    valid_rules = ["100", "110", "120", "auto"]
-    if allocation_rule.lower() not in valid_rules:
+    if allocation_rule.lower() not in VALID_ALLOCATION_RULES:
         return {
-            "error": f"Invalid allocation rule. Must be one of: {', '.join(valid_rules)}"
+            "error": f"Invalid allocation rule. Must be one of: {', '.join(VALID_ALLOCATION_RULES)}"
         }
 
     # Auto-select rule based on risk tolerance and age
@@ -697,14 +789,14 @@ def calculate_capital_gains_tax(
     # Calculate tax based on asset type and holding period
     if is_equity:
         # Equity: LTCG if held > 365 days, else STCG
-        equity_ltcg_threshold = 365
-        equity_ltcg_exemption = 125000  # ₹1.25 lakh exemption
+        equity_ltcg_threshold = EQUITY_LTCG_THRESHOLD_DAYS
+        equity_ltcg_exemption = EQUITY_LTCG_EXEMPTION
 
         if holding_period_days > equity_ltcg_threshold:
             # Long Term Capital Gains - Equity
             tax_type = "LTCG - Equity"
             taxable_gain = max(0, total_gain - equity_ltcg_exemption)
-            tax_rate = 12.5
+            tax_rate = LTCG_RATE
             tax_amount = taxable_gain * (tax_rate / 100)
             exemption_used = min(total_gain, equity_ltcg_exemption)
 
@@ -733,7 +825,7 @@ def calculate_capital_gains_tax(
             # Short Term Capital Gains - Equity
             tax_type = "STCG - Equity"
             taxable_gain = total_gain
-            tax_rate = 20
+            tax_rate = EQUITY_STCG_RATE
             tax_amount = taxable_gain * (tax_rate / 100)
 
             return {
@@ -757,14 +849,14 @@ def calculate_capital_gains_tax(
             }
     else:
         # Debt: LTCG if held > 36 months (3 years), else STCG
-        debt_ltcg_threshold = 1095  # 36 months = 3 years
+        debt_ltcg_threshold = DEBT_LTCG_THRESHOLD_DAYS
 
         if holding_period_days > debt_ltcg_threshold:
             # Long Term Capital Gains - Debt
             # Note: Indexation benefit was removed from April 2023
             tax_type = "LTCG - Debt"
             taxable_gain = total_gain
-            tax_rate = 12.5
+            tax_rate = LTCG_RATE
             tax_amount = taxable_gain * (tax_rate / 100)
 
             return {
@@ -791,9 +883,9 @@ def calculate_capital_gains_tax(
             tax_type = "STCG - Debt"
             taxable_gain = total_gain
             # Debt STCG is added to income and taxed at slab rate
-            # Assuming highest slab for calculation (30% + 4% cess = 31.2%)
-            assumed_slab_rate = 30
-            cess = 4  # 4% cess on income tax
+            # Assuming highest slab plus cess for calculation
+            assumed_slab_rate = DEBT_STCG_ASSUMED_SLAB_RATE
+            cess = INCOME_TAX_CESS_RATE
             effective_rate = assumed_slab_rate * (1 + cess / 100)
             tax_amount = taxable_gain * (effective_rate / 100)
 
@@ -806,20 +898,144 @@ def calculate_capital_gains_tax(
                 "total_gain": round(total_gain, 2),
                 "tax_type": tax_type,
                 "taxable_gain": round(taxable_gain, 2),
-                "tax_rate": f"As per income tax slab (assumed {assumed_slab_rate}% + 4% cess)",
+                "tax_rate": f"As per income tax slab (assumed {assumed_slab_rate}% + {cess}% cess)",
                 "assumed_tax_rate": f"{round(effective_rate, 2)}%",
                 "estimated_tax_amount": round(tax_amount, 2),
                 "net_proceeds": round(total_sell_value - tax_amount, 2),
                 "effective_tax_rate": f"{round((tax_amount/total_gain)*100, 2)}%",
                 "notes": [
                     "STCG on debt is added to your total income",
-                    f"Tax calculated assuming {assumed_slab_rate}% tax slab + 4% cess",
+                    f"Tax calculated assuming {assumed_slab_rate}% tax slab + {cess}% cess",
                     "Actual tax depends on your total income and tax slab",
                     "If in 20% or 10% slab, actual tax will be lower",
                 ],
             }
 
 
+@tool
+def calculate_capital_gains_tax_for_lots(
+    lots: str,
+    sell_price: float,
+    is_equity: bool = True,
+) -> Dict[str, Any]:
+    """
+    Calculate capital gains tax for selling several purchase lots of one holding.
+
+    All lots are priced in one vectorized pass, so this stays fast for
+    portfolios with hundreds or thousands of tax lots.
+
+    Args:
+        lots: JSON string of purchase lots, e.g.,
+              '[{"buy_price": 2400, "quantity": 10, "holding_period_days": 400}, ...]'
+        sell_price: Selling price per unit/share (same for all lots)
+        is_equity: True for equity/equity mutual funds, False for debt instruments
+
+    Returns:
+        Dictionary with short-term and long-term gains and the total tax
+
+    Loss set-off: short-term losses offset short-term gains first, then
+    long-term gains; long-term losses only offset long-term gains. The
+    ₹1.25 lakh equity LTCG exemption is applied once across all lots.
+    """
+    try:
+        import numpy as np
+
+        lots_list = json.loads(lots)
+
+        if not isinstance(lots_list, list) or not lots_list:
+            return {"error": "Lots must be a non-empty JSON array of objects"}
+
+        if sell_price <= 0:
+            return {"error": "Sell price must be greater than 0"}
+
+        buy_prices = np.array([lot["buy_price"] for lot in lots_list], dtype=float)
+        quantities = np.array([lot["quantity"] for lot in lots_list], dtype=float)
+        holding_days = np.array(
+            [lot["holding_period_days"] for lot in lots_list], dtype=np.int64
+        )
+
+        if (buy_prices <= 0).any():
+            return {"error": "Buy prices must be greater than 0"}
+        if (quantities <= 0).any():
+            return {"error": "Quantities must be greater than 0"}
+        if (holding_days < 0).any():
+            return {"error": "Holding periods cannot be negative"}
+
+        threshold = (
+            EQUITY_LTCG_THRESHOLD_DAYS if is_equity else DEBT_LTCG_THRESHOLD_DAYS
+        )
+        gains = (sell_price - buy_prices) * quantities
+        is_long_term = holding_days > threshold
+
+        net_short_term = float(gains[~is_long_term].sum())
+        net_long_term = float(gains[is_long_term].sum())
+
+        # Set off short-term losses against long-term gains
+        if net_short_term < 0 < net_long_term:
+            net_long_term = max(0.0, net_long_term + net_short_term)
+            net_short_term = 0.0
+
+        stcg = max(0.0, net_short_term)
+        ltcg = max(0.0, net_long_term)
+
+        if is_equity:
+            exemption_used = min(ltcg, EQUITY_LTCG_EXEMPTION)
+            ltcg_tax = (ltcg - exemption_used) * (LTCG_RATE / 100)
+            stcg_tax = stcg * (EQUITY_STCG_RATE / 100)
+            stcg_rate = f"{EQUITY_STCG_RATE}%"
+        else:
+            exemption_used = 0.0
+            ltcg_tax = ltcg * (LTCG_RATE / 100)
+            # Debt STCG taxed at slab rate, assumed highest slab + cess
+            stcg_tax = (
+                stcg
+                * (DEBT_STCG_ASSUMED_SLAB_RATE / 100)
+                * (1 + INCOME_TAX_CESS_RATE / 100)
+            )
+            stcg_rate = f"As per income tax slab (assumed {DEBT_STCG_ASSUMED_SLAB_RATE}% + {INCOME_TAX_CESS_RATE}% cess)"
+
+        total_tax = stcg_tax + ltcg_tax
+        total_sell_value = float(sell_price * quantities.sum())
+
+        return {
+            "transaction_type": "Equity" if is_equity else "Debt",
+            "lots_count": len(lots_list),
+            "long_term_lots": int(is_long_term.sum()),
+            "short_term_lots": int((~is_long_term).sum()),
+            "total_quantity": float(quantities.sum()),
+            "buy_value": round(float((buy_prices * quantities).sum()), 2),
+            "sell_value": round(total_sell_value, 2),
+            "total_gain_or_loss": round(float(gains.sum()), 2),
+            "short_term": {
+                "net_gain": round(stcg, 2),
+                "tax_rate": stcg_rate,
+                "tax_amount": round(stcg_tax, 2),
+            },
+            "long_term": {
+                "net_gain": round(ltcg, 2),
+                "exemption_used": round(exemption_used, 2),
+                "tax_rate": f"{LTCG_RATE}%",
+                "tax_amount": round(ltcg_tax, 2),
+            },
+            "total_tax": round(total_tax, 2),
+            "net_proceeds": round(total_sell_value - total_tax, 2),
+            "notes": [
+                f"Lots held more than {threshold} days are treated as long term",
+                "Unabsorbed capital losses can be carried forward for 8 years",
+            ],
+        }
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON format for lots: {str(e)}"}
+    except (KeyError, TypeError, ValueError) as e:
+        return {"error": f"Invalid lot entry: {str(e)}"}
+    except ImportError:
+        return {
+            "error": "numpy package not installed. Install with: pip install numpy"
+        }
+    except Exception as e:
+        return {"error": f"Failed to calculate capital gains tax: {str(e)}"}
+
+
 @tool
 def calculate_sip_returns(
     monthly_investment: float,
@@ -1497,26 +1713,37 @@ def suggest_rebalancing(
 
 
 # =============================================================================
-# AGENT DEFINITIONS
+# SHARED TOOL SETS
 # =============================================================================
 
+# Several agents register the same tools; build each group once and reuse it
+# across agents.
+_COMMON_MARKET_TOOLS = (get_stock_metrics, get_index_data)
 
-def get_agents() -> List[Agent]:
-    """
-    Create and return all Investment Helper Team agents.
-    Consolidated from 5 agents to 3 for efficiency and reduced redundancy.
+_OVERVIEW_TOOLS = (
+    get_stock_history,
+    get_indian_market_overview,
+    get_global_market_overview,
+)
 
-    Returns:
-        List of configured Agent instances
-    """
-    llm = get_llm(model="gpt-5-nano", provider="openai")
+_PLANNING_TOOLS = (
+    calculate_sip_returns,
+    calculate_sip_for_goal,
+    calculate_goal_corpus,
+    calculate_capital_gains_tax,
+)
 
-    # 1. Market Intelligence Agent (Consolidated: Stock + Indian + Global Market Analysts)
-    market_intelligence_agent = Agent(
-        name="Market Intelligence Agent",
-        role="Comprehensive Market Analyst",
-        description="A comprehensive market analyst covering all market research needs - stocks, indices, sectors, and global markets. Use this agent when you need to: analyze specific stocks (Indian/US), track market indices (Nifty 50, Sensex, S&P 500, Nasdaq), understand sector trends (IT, Banking, Pharma, FMCG, Auto), review historical performance, get market sentiment analysis, understand global market impact on India, or research international diversification opportunities. Ideal for queries like 'Analyze TCS stock', 'How is Sensex performing?', 'What's the trend in IT sector?', 'Compare Indian vs US markets', 'Should I invest in banking stocks?', or 'How are global markets affecting Indian stocks?'.",
-        instructions="""You are a comprehensive market analyst covering stocks, indices, sectors, and global markets. Your role is to:
+
+# =============================================================================
+# AGENT PROMPTS
+# =============================================================================
+
+# Prompt text lives at module scope so it is created once per process and
+# shared by every Agent/Team built from it.
+
+_MARKET_INTELLIGENCE_DESCRIPTION: Final[str] = "A comprehensive market analyst covering all market research needs - stocks, indices, sectors, and global markets. Use this agent when you need to: analyze specific stocks (Indian/US), track market indices (Nifty 50, Sensex, S&P 500, Nasdaq), understand sector trends (IT, Banking, Pharma, FMCG, Auto), review historical performance, get market sentiment analysis, understand global market impact on India, or research international diversification opportunities. Ideal for queries like 'Analyze TCS stock', 'How is Sensex performing?', 'What's the trend in IT sector?', 'Compare Indian vs US markets', 'Should I invest in banking stocks?', or 'How are global markets affecting Indian stocks?'."
+
+_MARKET_INTELLIGENCE_INSTRUCTIONS: Final[str] = """You are a comprehensive market analyst covering stocks, indices, sectors, and global markets. Your role is to:
 
 STOCK ANALYSIS:
 1. Perform deep dives into specific stocks using real-time data
@@ -1587,24 +1814,11 @@ Always provide:
 - Sector/market comparisons
 - Both bullish and bearish perspectives
 - Risk factors and cautions
-- News and sentiment analysis when relevant""",
-        model=llm,
-        tools=[
-            get_stock_metrics,
-            get_stock_history,
-            get_index_data,
-            get_indian_market_overview,
-            get_global_market_overview,
-            SerperTools(location="in"),
-        ],
-    )
+- News and sentiment analysis when relevant"""
 
-    # 2. Investment Advisor (Enhanced Investment Helper with Education + Tax + Goal Planning)
-    investment_advisor_agent = Agent(
-        name="Investment Advisor",
-        role="Investment Education & Planning Specialist",
-        description="An investment education and planning specialist covering concepts, instruments, SIP planning, goal-based investing, and tax guidance. Use this agent when you need to: understand investment concepts (SIP, mutual funds, ELSS, NPS, PPF, bonds), calculate SIP returns and projections, plan for financial goals (child's education, marriage, retirement, home), understand tax implications (LTCG/STCG/capital gains), get explanations of financial jargon, learn investment strategies, or explore different investment instruments. Ideal for queries like 'What is a mutual fund?', 'Calculate SIP returns for ₹10K/month', 'How much SIP for ₹1 crore goal?', 'Plan for child's education in 15 years', 'Explain capital gains tax', 'What is ELSS?', 'How does NPS work?', 'SIP vs lump sum?', or 'Best tax-saving investments?'.",
-        instructions="""You are an investment education and planning specialist. Your role is to:
+_INVESTMENT_ADVISOR_DESCRIPTION: Final[str] = "An investment education and planning specialist covering concepts, instruments, SIP planning, goal-based investing, and tax guidance. Use this agent when you need to: understand investment concepts (SIP, mutual funds, ELSS, NPS, PPF, bonds), calculate SIP returns and projections, plan for financial goals (child's education, marriage, retirement, home), understand tax implications (LTCG/STCG/capital gains), get explanations of financial jargon, learn investment strategies, or explore different investment instruments. Ideal for queries like 'What is a mutual fund?', 'Calculate SIP returns for ₹10K/month', 'How much SIP for ₹1 crore goal?', 'Plan for child's education in 15 years', 'Explain capital gains tax', 'What is ELSS?', 'How does NPS work?', 'SIP vs lump sum?', or 'Best tax-saving investments?'."
+
+_INVESTMENT_ADVISOR_INSTRUCTIONS: Final[str] = """You are an investment education and planning specialist. Your role is to:
 
 INVESTMENT EDUCATION:
 1. Explain investment concepts in simple, clear language
@@ -1704,25 +1918,11 @@ IMPORTANT PRINCIPLES:
 - Increase investments with income growth
 - Review and rebalance periodically
 - Emergency fund before investing
-- Insurance before investing""",
-        model=llm,
-        tools=[
-            calculate_sip_returns,
-            calculate_sip_for_goal,
-            calculate_goal_corpus,
-            calculate_capital_gains_tax,
-            get_stock_metrics,
-            get_index_data,
-            SerperTools(location="in"),
-        ],
-    )
+- Insurance before investing"""
 
-    # 3. Portfolio Manager (Keep as-is - specialized portfolio management)
-    portfolio_manager_agent = Agent(
-        name="Portfolio Manager",
-        role="Portfolio Analyst & Manager",
-        description="A portfolio management specialist focused on portfolio analysis, allocation, and rebalancing. Use this agent when you need to: analyze your current holdings and portfolio composition, get asset allocation recommendations based on age and risk tolerance using modern allocation rules (110-age or 120-age), understand portfolio diversification (sector/market cap/gold), calculate tax implications of rebalancing, plan future SIP contributions for specific goals, identify concentration risks, or get rebalancing suggestions. Ideal for queries like 'Review my portfolio', 'Should I rebalance my investments?', 'What should be my equity-debt allocation?', 'What's the tax impact of selling?', 'How much SIP should I start?', 'Plan for child's education with existing portfolio', or 'Analyze my sector diversification'.",
-        instructions="""You are a portfolio management specialist. Your role is to:
+_PORTFOLIO_MANAGER_DESCRIPTION: Final[str] = "A portfolio management specialist focused on portfolio analysis, allocation, and rebalancing. Use this agent when you need to: analyze your current holdings and portfolio composition, get asset allocation recommendations based on age and risk tolerance using modern allocation rules (110-age or 120-age), understand portfolio diversification (sector/market cap/gold), calculate tax implications of rebalancing, plan future SIP contributions for specific goals, identify concentration risks, or get rebalancing suggestions. Ideal for queries like 'Review my portfolio', 'Should I rebalance my investments?', 'What should be my equity-debt allocation?', 'What's the tax impact of selling?', 'How much SIP should I start?', 'Plan for child's education with existing portfolio', or 'Analyze my sector diversification'."
+
+_PORTFOLIO_MANAGER_INSTRUCTIONS: Final[str] = """You are a portfolio management specialist. Your role is to:
 
 1. Review and analyze user's current holdings
 2. Break down portfolio by market cap (Large/Mid/Small cap)
@@ -1751,7 +1951,8 @@ Portfolio analysis includes:
 - Concentration risks
 - Sector overweight/underweight
 - Rebalancing recommendations with specific amounts
-- Tax impact of selling positions (use calculate_capital_gains_tax)
+- Tax impact of selling positions (use calculate_capital_gains_tax, or calculate_capital_gains_tax_for_lots when a holding was bought in several lots)
+- Recent performance of holdings (use get_stock_history_batch with all tickers at once rather than one call per holding)
 - Future growth projections with SIP
 - Gap analysis for financial goals
 
@@ -1784,40 +1985,11 @@ Always ask for:
 - Current holdings with quantities
 - Purchase price and date (for tax calculation)
 - Monthly investment capacity (for SIP planning)
-- Financial goals and timelines (if relevant)""",
-        model=llm,
-        tools=[
-            analyze_portfolio_allocation,
-            calculate_age_based_allocation,
-            suggest_rebalancing,
-            calculate_capital_gains_tax,
-            calculate_sip_returns,
-            calculate_sip_for_goal,
-            calculate_goal_corpus,
-            get_stock_metrics,
-        ],
-    )
+- Financial goals and timelines (if relevant)"""
 
-    return [
-        market_intelligence_agent,
-        investment_advisor_agent,
-        portfolio_manager_agent,
-    ]
+_INVESTMENT_HELPER_TEAM_DESCRIPTION: Final[str] = "A comprehensive investment advisory team providing wealth management, market analysis, and portfolio guidance. Use this team for: analyzing stocks and markets (Indian/Global), tracking indices (Nifty/Sensex/S&P 500), understanding investment concepts and instruments (SIP/mutual funds/ELSS/NPS), portfolio review and rebalancing, asset allocation strategies, SIP planning and goal-based investing, capital gains tax calculations, market trends and sector analysis, or general investment education. The team includes 3 specialized agents (Market Intelligence, Investment Advisor, Portfolio Manager) who work collaboratively to provide holistic financial guidance."
 
-
-def get_teams() -> List[Team]:
-    """
-    Create and return the Investment Helper Team.
-    Consolidated from 5 agents to 3 for improved efficiency.
-
-    Returns:
-        Configured Team instance
-    """
-    investment_helper_team = Team(
-        name="Investment Helper Team",
-        description="A comprehensive investment advisory team providing wealth management, market analysis, and portfolio guidance. Use this team for: analyzing stocks and markets (Indian/Global), tracking indices (Nifty/Sensex/S&P 500), understanding investment concepts and instruments (SIP/mutual funds/ELSS/NPS), portfolio review and rebalancing, asset allocation strategies, SIP planning and goal-based investing, capital gains tax calculations, market trends and sector analysis, or general investment education. The team includes 3 specialized agents (Market Intelligence, Investment Advisor, Portfolio Manager) who work collaboratively to provide holistic financial guidance.",
-        members=get_agents(),
-        instructions="""You are a team of investment professionals specializing in wealth management and market analysis.
+_INVESTMENT_HELPER_TEAM_INSTRUCTIONS: Final[str] = """You are a team of investment professionals specializing in wealth management and market analysis.
 
 Your team has been optimized to 3 specialized agents:
 
@@ -1869,9 +2041,108 @@ Always provide:
 - Risk warnings
 - Tax implications when relevant
 - Multiple options where applicable
-- Encouragement to seek professional advice for personalized guidance""",
+- Encouragement to seek professional advice for personalized guidance"""
+
+
+# =============================================================================
+# AGENT DEFINITIONS
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def get_agents() -> List["Agent"]:
+    """
+    Create and return all Investment Helper Team agents.
+    Consolidated from 5 agents to 3 for efficiency and reduced redundancy.
+
+    Built once per process and cached. get_teams() builds its own member
+    instances, since agno records the owning team on each member.
+
+    Returns:
+        List of configured Agent instances
+    """
+    from agno.agent import Agent
+
+    from core.serper import SerperTools
+
+    llm = get_llm(model="gpt-5-nano", provider="openai")
+    # One search toolkit shared by the research agents
+    serper_tools = SerperTools(location="in")
+
+    # 1. Market Intelligence Agent (Consolidated: Stock + Indian + Global Market Analysts)
+    market_intelligence_agent = Agent(
+        name="Market Intelligence Agent",
+        role="Comprehensive Market Analyst",
+        description=_MARKET_INTELLIGENCE_DESCRIPTION,
+        instructions=_MARKET_INTELLIGENCE_INSTRUCTIONS,
+        model=llm,
+        tools=[*_COMMON_MARKET_TOOLS, *_OVERVIEW_TOOLS, serper_tools],
+    )
+
+    # 2. Investment Advisor (Enhanced Investment Helper with Education + Tax + Goal Planning)
+    investment_advisor_agent = Agent(
+        name="Investment Advisor",
+        role="Investment Education & Planning Specialist",
+        description=_INVESTMENT_ADVISOR_DESCRIPTION,
+        instructions=_INVESTMENT_ADVISOR_INSTRUCTIONS,
+        model=llm,
+        tools=[*_PLANNING_TOOLS, *_COMMON_MARKET_TOOLS, serper_tools],
+    )
+
+    # 3. Portfolio Manager (Keep as-is - specialized portfolio management)
+    portfolio_manager_agent = Agent(
+        name="Portfolio Manager",
+        role="Portfolio Analyst & Manager",
+        description=_PORTFOLIO_MANAGER_DESCRIPTION,
+        instructions=_PORTFOLIO_MANAGER_INSTRUCTIONS,
+        model=llm,
+        tools=[
+            analyze_portfolio_allocation,
+            calculate_age_based_allocation,
+            suggest_rebalancing,
+            *_PLANNING_TOOLS,
+            calculate_capital_gains_tax_for_lots,
+            get_stock_metrics,
+            get_stock_history_batch,
+        ],
+    )
+
+    agents = [
+        market_intelligence_agent,
+        investment_advisor_agent,
+        portfolio_manager_agent,
+    ]
+    prepare_tools(agents)
+    return agents
+
+
+@lru_cache(maxsize=1)
+def get_teams() -> List["Team"]:
+    """
+    Create and return the Investment Helper Team.
+    Consolidated from 5 agents to 3 for improved efficiency.
+
+    Built once per process and cached: agents and teams hold configuration
+    only, while per-run state lives in agno's run context and session storage.
+
+    Returns:
+        Configured Team instance
+    """
+    from agno.team import Team
+
+    investment_helper_team = Team(
+        name="Investment Helper Team",
+        description=_INVESTMENT_HELPER_TEAM_DESCRIPTION,
+        members=get_agents.__wrapped__(),
+        instructions=_INVESTMENT_HELPER_TEAM_INSTRUCTIONS,
         model=get_llm(model="gpt-5-nano", provider="openai"),
         markdown=True,
     )
 
     return [investment_helper_team]
+
+
+def reset_teams() -> None:
+    """Drop the cached Investment Helper Team and agents so the next calls rebuild them."""
+    get_agents.cache_clear()
+    get_teams.cache_clear()
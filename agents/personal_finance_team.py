@@ -6,38 +6,103 @@ Agents (Consolidated from 4 to 2 for efficiency):
 2. Tax & Compliance Specialist - Tax optimization and compliance (Indian IT rules)
 """
 
-from typing import List
-from agno.agent import Agent
-from agno.knowledge import Knowledge
-from agno.knowledge.embedder.sentence_transformer import SentenceTransformerEmbedder
-from agno.team import Team
+import logging
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Final, List
 from agno.tools import tool
-from agno.tools.serper import SerperTools
-from agno.vectordb.chroma import ChromaDb
 
+from core.finmath import emi as loan_emi, loan_for_emi
 from core.llm import get_llm
+from core.tools import prepare_tools
 
 # Import capital gains tax calculation from investment team (single source of truth)
 from agents.investment_team import calculate_capital_gains_tax
 
+logger = logging.getLogger(__name__)
+
+# Annotation-only; get_knowledge_base() and the factories import these
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.knowledge import Knowledge
+    from agno.team import Team
+
+
+def _warm_knowledge_base(knowledge_base: "Knowledge") -> None:
+    """
+    Issue a throwaway search so the persisted Chroma index is loaded before
+    the first real query instead of during it.
+    """
+    try:
+        knowledge_base.search("warmup", max_results=1)
+    except Exception:
+        logger.warning("Knowledge base warmup failed", exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_knowledge_base() -> "Knowledge":
+    """
+    Get the shared financial documents knowledge base, creating it on first use.
+
+    Construction loads the sentence-transformer model and opens the persistent
+    Chroma client, so it is deferred until an agent or team that searches the
+    documents is built rather than paid on module import.
+
+    Returns:
+        Knowledge base backed by ChromaDB at tmp/chroma
+    """
+    # Imported here: these pull in chromadb and sentence-transformers/torch
+    from agno.vectordb.chroma import ChromaDb
+
+    from core.embedder import BatchSentenceTransformerEmbedder
+    from core.knowledge import CachedKnowledge
+
+    knowledge_base = CachedKnowledge(
+        name="Financial Documents",
+        description="This is a knowledge base for financial documents which includes income tax documents, personal financing documents, etc.",
+        vector_db=ChromaDb(
+            collection="financial_documents",
+            path="tmp/chroma",
+            persistent_client=True,
+            embedder=BatchSentenceTransformerEmbedder(id="all-MiniLM-L6-v2"),
+        ),
+        max_results=10,
+    )
+    threading.Thread(
+        target=_warm_knowledge_base,
+        args=(knowledge_base,),
+        name="knowledge-base-warmup",
+        daemon=True,
+    ).start()
+    return knowledge_base
 
-knowledge_base = Knowledge(
-    name="Financial Documents",
-    description="This is a knowledge base for financial documents which includes income tax documents, personal financing documents, etc.",
-    vector_db=ChromaDb(
-        collection="financial_documents",
-        path="tmp/chroma",
-        persistent_client=True,
-        embedder=SentenceTransformerEmbedder(id="all-MiniLM-L6-v2"),
-    ),
-    max_results=10,
-)
 
 # =============================================================================
 # CUSTOM TOOLS FOR PERSONAL FINANCE TEAM
 # =============================================================================
 
 
+def _fmt_inr(amount: float) -> str:
+    """
+    Format a rupee amount for human-readable notes with Indian digit grouping
+    (thousands, then lakhs and crores), e.g. '₹12,50,000.00'.
+    """
+    sign = "-" if amount < 0 else ""
+    whole, fraction = f"{abs(amount):.2f}".split(".")
+    head, tail = whole[:-3], whole[-3:]
+    groups = []
+    while head:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    return f"{sign}₹{','.join([*groups, tail])}.{fraction}"
+
+
+def _r2(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Round the float values of a result dict to 2 places, leaving other values as-is."""
+    return {k: round(v, 2) if isinstance(v, float) else v for k, v in values.items()}
+
+
 @tool
 def calculate_life_insurance_coverage(
     annual_income: float, multiplier: float = 15.0
@@ -66,6 +131,11 @@ def calculate_life_insurance_coverage(
     }
 
 
+# Emergency fund base months by job stability (3-6-12 Month Rule)
+EMERGENCY_FUND_STABILITY_MONTHS = MappingProxyType({"high": 3, "moderate": 6, "low": 12})
+EMERGENCY_FUND_MAX_MONTHS = 12
+
+
 @tool
 def calculate_emergency_fund(
     monthly_expenses: float,
@@ -83,20 +153,15 @@ def calculate_emergency_fund(
     Returns:
         Dictionary with emergency fund recommendations
     """
-    # Base months based on job stability
-    stability_months = {
-        "high": 3,
-        "moderate": 6,
-        "low": 12,
-    }
-
-    base_months = stability_months.get(job_stability.lower(), 6)
+    base_months = EMERGENCY_FUND_STABILITY_MONTHS.get(
+        job_stability.lower(), EMERGENCY_FUND_STABILITY_MONTHS["moderate"]
+    )
 
     # Add 1 month for each dependent
     total_months = base_months + dependents
 
     # Cap at 12 months
-    total_months = min(total_months, 12)
+    total_months = min(total_months, EMERGENCY_FUND_MAX_MONTHS)
 
     emergency_fund = monthly_expenses * total_months
 
@@ -110,6 +175,10 @@ def calculate_emergency_fund(
     }
 
 
+# 50-30-20 rule: savings + investments should be at least 20% of income
+IDEAL_SAVINGS_PCT = 20
+
+
 @tool
 def analyze_spending_ratio(
     monthly_income: float,
@@ -127,18 +196,26 @@ def analyze_spending_ratio(
     Returns:
         Dictionary with spending analysis and recommendations
     """
+    if monthly_income <= 0:
+        return {"error": "Monthly income must be greater than 0"}
+
     total_saved = monthly_savings + monthly_investments
     spending = monthly_income - total_saved
 
-    spending_pct = (spending / monthly_income) * 100
-    savings_pct = (monthly_savings / monthly_income) * 100
-    investment_pct = (monthly_investments / monthly_income) * 100
+    pct_of_income = 100 / monthly_income
+    spending_pct = spending * pct_of_income
+    savings_pct = monthly_savings * pct_of_income
+    investment_pct = monthly_investments * pct_of_income
 
     # 50-30-20 rule: 50% needs, 30% wants, 20% savings
     ideal_spending_pct = 80  # Needs + Wants
-    ideal_savings_pct = 20  # Savings + Investments
+    ideal_savings_pct = IDEAL_SAVINGS_PCT  # Savings + Investments
 
-    status = "healthy" if (savings_pct + investment_pct) >= 20 else "needs_improvement"
+    status = (
+        "healthy"
+        if (savings_pct + investment_pct) >= IDEAL_SAVINGS_PCT
+        else "needs_improvement"
+    )
 
     return {
         "monthly_income": monthly_income,
@@ -153,6 +230,128 @@ def analyze_spending_ratio(
     }
 
 
+@tool
+def analyze_spending_ratio_batch(
+    monthly_incomes: List[float],
+    monthly_savings: List[float],
+    monthly_investments: List[float],
+) -> dict:
+    """
+    Analyze spending vs investment ratio (50-30-20 rule) for several scenarios at once.
+
+    Use this to compare months, household members or what-if budgets instead of
+    calling analyze_spending_ratio once per scenario.
+
+    Args:
+        monthly_incomes: Monthly income in INR for each scenario
+        monthly_savings: Monthly savings in INR for each scenario
+        monthly_investments: Monthly investments in INR for each scenario
+
+    Returns:
+        Dictionary with the spending analysis of each scenario, in input order
+    """
+    if not monthly_incomes:
+        return {"error": "Provide at least one scenario"}
+    if not len(monthly_incomes) == len(monthly_savings) == len(monthly_investments):
+        return {
+            "error": "monthly_incomes, monthly_savings and monthly_investments must have the same length"
+        }
+
+    try:
+        import numpy as np
+
+        income = np.asarray(monthly_incomes, dtype=np.float64)
+        savings = np.asarray(monthly_savings, dtype=np.float64)
+        investments = np.asarray(monthly_investments, dtype=np.float64)
+
+        valid = income > 0
+        spending = income - (savings + investments)
+        # Zero-income scenarios get 0 instead of inf/nan and are reported as errors
+        pct_of_income = np.divide(100, income, out=np.zeros_like(income), where=valid)
+        spending_pct = np.round(spending * pct_of_income, 2)
+        savings_pct = np.round(savings * pct_of_income, 2)
+        investment_pct = np.round(investments * pct_of_income, 2)
+        total_pct = (savings + investments) * pct_of_income
+
+        return {
+            "ideal_savings_pct": IDEAL_SAVINGS_PCT,
+            "scenarios": [
+                (
+                    {
+                        "monthly_income": float(income[i]),
+                        "spending": float(spending[i]),
+                        "spending_percentage": float(spending_pct[i]),
+                        "savings_percentage": float(savings_pct[i]),
+                        "investment_percentage": float(investment_pct[i]),
+                        "total_savings_investment_pct": round(float(total_pct[i]), 2),
+                        "status": (
+                            "healthy"
+                            if total_pct[i] >= IDEAL_SAVINGS_PCT
+                            else "needs_improvement"
+                        ),
+                    }
+                    if valid[i]
+                    else {
+                        "monthly_income": float(income[i]),
+                        "error": "Monthly income must be greater than 0",
+                    }
+                )
+                for i in range(len(income))
+            ],
+            "rule": "50-30-20 Rule (50% needs, 30% wants, 20% savings)",
+        }
+    except ImportError:
+        return {"error": "numpy is required for batch analysis. Install with: pip install numpy"}
+
+
+# Spending benchmarks by age group (percentage of income)
+SPENDING_BENCHMARKS = {
+    "20-30": {
+        "dining": 10,
+        "entertainment": 8,
+        "shopping": 12,
+        "transportation": 10,
+        "utilities": 8,
+        "groceries": 15,
+    },
+    "30-40": {
+        "dining": 8,
+        "entertainment": 6,
+        "shopping": 10,
+        "transportation": 12,
+        "utilities": 10,
+        "groceries": 18,
+    },
+    "40-50": {
+        "dining": 6,
+        "entertainment": 5,
+        "shopping": 8,
+        "transportation": 12,
+        "utilities": 12,
+        "groceries": 20,
+    },
+    "50+": {
+        "dining": 5,
+        "entertainment": 4,
+        "shopping": 6,
+        "transportation": 10,
+        "utilities": 15,
+        "groceries": 22,
+    },
+}
+DEFAULT_BENCHMARK_AGE_GROUP = "30-40"
+SPENDING_CATEGORIES = tuple(SPENDING_BENCHMARKS[DEFAULT_BENCHMARK_AGE_GROUP])
+
+# Flattened (age_group, category) -> percentage, for a single lookup per call
+_SPENDING_BENCHMARKS_FLAT = MappingProxyType(
+    {
+        (age, category): pct
+        for age, row in SPENDING_BENCHMARKS.items()
+        for category, pct in row.items()
+    }
+)
+
+
 @tool
 def get_spending_benchmarks(age_group: str, category: str) -> dict:
     """
@@ -166,49 +365,17 @@ def get_spending_benchmarks(age_group: str, category: str) -> dict:
     Returns:
         Dictionary with benchmark data for the category
     """
-    # Benchmark data (percentage of income)
-    benchmarks = {
-        "20-30": {
-            "dining": 10,
-            "entertainment": 8,
-            "shopping": 12,
-            "transportation": 10,
-            "utilities": 8,
-            "groceries": 15,
-        },
-        "30-40": {
-            "dining": 8,
-            "entertainment": 6,
-            "shopping": 10,
-            "transportation": 12,
-            "utilities": 10,
-            "groceries": 18,
-        },
-        "40-50": {
-            "dining": 6,
-            "entertainment": 5,
-            "shopping": 8,
-            "transportation": 12,
-            "utilities": 12,
-            "groceries": 20,
-        },
-        "50+": {
-            "dining": 5,
-            "entertainment": 4,
-            "shopping": 6,
-            "transportation": 10,
-            "utilities": 15,
-            "groceries": 22,
-        },
-    }
-
-    age_benchmarks = benchmarks.get(age_group, benchmarks["30-40"])
-    category_benchmark = age_benchmarks.get(category.lower(), None)
+    lookup_age_group = (
+        age_group if age_group in SPENDING_BENCHMARKS else DEFAULT_BENCHMARK_AGE_GROUP
+    )
+    category_benchmark = _SPENDING_BENCHMARKS_FLAT.get(
+        (lookup_age_group, category.lower())
+    )
 
     if category_benchmark is None:
         return {
             "error": f"Category '{category}' not found",
-            "available_categories": list(age_benchmarks.keys()),
+            "available_categories": list(SPENDING_CATEGORIES),
         }
 
     return {
@@ -382,9 +549,10 @@ def calculate_hra_exemption(
     - Rent paid minus 10% of basic salary
     - 50% of basic salary (metro) or 40% (non-metro)
     """
-    # Calculate the three components
+    # Calculate the three components (rent excess floored at zero once, and
+    # reused below; flooring it does not change the minimum's sign)
     actual_hra = hra_received
-    rent_minus_10pct_basic = rent_paid - (basic_salary * 0.10)
+    rent_minus_10pct_basic = max(0, rent_paid - (basic_salary * 0.10))
     metro_percentage = 0.50 if is_metro else 0.40
     basic_percentage = basic_salary * metro_percentage
 
@@ -401,7 +569,7 @@ def calculate_hra_exemption(
         "is_metro": is_metro,
         "calculation_components": {
             "actual_hra_received": actual_hra,
-            "rent_minus_10pct_basic": max(0, rent_minus_10pct_basic),
+            "rent_minus_10pct_basic": rent_minus_10pct_basic,
             "basic_salary_percentage": basic_percentage,
             "percentage_used": f"{int(metro_percentage * 100)}%",
         },
@@ -412,6 +580,11 @@ def calculate_hra_exemption(
     }
 
 
+# Section 24 home loan interest deduction limit by property type (None = no limit)
+SECTION_24_SELF_OCCUPIED_LIMIT = 200000
+SECTION_24_LIMITS = {"self_occupied": SECTION_24_SELF_OCCUPIED_LIMIT, "let_out": None}
+
+
 @tool
 def calculate_section_24_interest(
     home_loan_interest_paid: float,
@@ -433,17 +606,14 @@ def calculate_section_24_interest(
     - Under-construction property: Interest during construction can be claimed
       in 5 equal installments after completion
     """
-    if property_type.lower() == "self_occupied":
-        max_limit = 200000
-        eligible_deduction = min(home_loan_interest_paid, max_limit)
-        remaining_amount = max(0, home_loan_interest_paid - max_limit)
-    elif property_type.lower() == "let_out":
-        max_limit = None  # No limit for let-out property
+    # Unknown property types are treated as self-occupied
+    max_limit = SECTION_24_LIMITS.get(
+        property_type.lower(), SECTION_24_SELF_OCCUPIED_LIMIT
+    )
+    if max_limit is None:
         eligible_deduction = home_loan_interest_paid
         remaining_amount = 0
     else:
-        # Default to self-occupied
-        max_limit = 200000
         eligible_deduction = min(home_loan_interest_paid, max_limit)
         remaining_amount = max(0, home_loan_interest_paid - max_limit)
 
@@ -452,16 +622,26 @@ def calculate_section_24_interest(
         "property_type": property_type,
         "eligible_deduction_section_24": round(eligible_deduction, 2),
         "deduction_limit": max_limit if max_limit else "No limit (let-out property)",
-        "non_deductible_amount": round(remaining_amount, 2) if max_limit else 0,
+        "non_deductible_amount": round(remaining_amount, 2),
         "note": (
             "Self-occupied: Max ₹2,00,000 | Let-out: No limit"
-            if property_type.lower() == "self_occupied"
+            if max_limit
             else "Let-out property has no deduction limit"
         ),
         "additional_info": "This is separate from Section 80C principal repayment deduction",
     }
 
 
+# LTA conditions returned with every exemption calculation
+LTA_RULES = (
+    "Can be claimed twice in a block of 4 calendar years",
+    "Current block: 2022-2025",
+    "Only travel fare is exempt (flight, train, bus tickets)",
+    "Hotel, food, and other expenses are not covered",
+    "Must submit travel bills to employer",
+)
+
+
 @tool
 def calculate_lta_exemption(
     lta_received: float,
@@ -501,16 +681,31 @@ def calculate_lta_exemption(
         "lta_exemption": round(lta_exemption, 2),
         "taxable_lta": round(taxable_lta, 2),
         "note": note,
-        "additional_rules": [
-            "Can be claimed twice in a block of 4 calendar years",
-            "Current block: 2022-2025",
-            "Only travel fare is exempt (flight, train, bus tickets)",
-            "Hotel, food, and other expenses are not covered",
-            "Must submit travel bills to employer",
-        ],
+        "additional_rules": list(LTA_RULES),
     }
 
 
+def _epf_future_value(
+    balance: float, monthly_contribution: float, monthly_rate: float, months: int
+) -> tuple[float, float]:
+    """
+    Future value of an existing balance and of monthly contributions paid in advance.
+
+    FV = P × (1 + r)^n + PMT × [((1 + r)^n - 1) / r] × (1 + r)
+
+    Returns:
+        Tuple of (future value of balance, future value of contributions)
+    """
+    if monthly_rate <= 0:
+        return balance, monthly_contribution * months
+
+    growth = (1 + monthly_rate) ** months
+    return (
+        balance * growth,
+        monthly_contribution * (growth - 1) / monthly_rate * (1 + monthly_rate),
+    )
+
+
 @tool
 def calculate_epf_vpf_returns(
     monthly_basic: float,
@@ -559,19 +754,10 @@ def calculate_epf_vpf_returns(
     months = years_to_retirement * 12
     monthly_rate = interest_rate / 12 / 100
 
-    if monthly_rate > 0:
-        # FV = P × (1 + r)^n + PMT × [((1 + r)^n - 1) / r] × (1 + r)
-        future_value_current = current_epf_balance * ((1 + monthly_rate) ** months)
-        future_value_contributions = (
-            total_monthly_contribution
-            * (((1 + monthly_rate) ** months - 1) / monthly_rate)
-            * (1 + monthly_rate)
-        )
-        maturity_amount = future_value_current + future_value_contributions
-    else:
-        maturity_amount = (
-            current_epf_balance + total_monthly_contribution * months
-        )
+    future_value_current, future_value_contributions = _epf_future_value(
+        current_epf_balance, total_monthly_contribution, monthly_rate, months
+    )
+    maturity_amount = future_value_current + future_value_contributions
 
     # Total contributions
     total_contributions = (total_monthly_contribution * months) + current_epf_balance
@@ -696,6 +882,48 @@ def calculate_retirement_corpus(
     }
 
 
+# Income tax slabs (FY 2024-25) as (threshold, marginal rate increase above it).
+# Old regime: 5% over ₹2.5L, 20% over ₹5L, 30% over ₹10L
+OLD_REGIME_SLABS = ((250000, 0.05), (500000, 0.15), (1000000, 0.10))
+# New regime: 5% over ₹3L, 10% over ₹7L, 15% over ₹10L, 20% over ₹12L, 30% over ₹15L
+NEW_REGIME_SLABS = (
+    (300000, 0.05),
+    (700000, 0.05),
+    (1000000, 0.05),
+    (1200000, 0.05),
+    (1500000, 0.10),
+)
+NEW_REGIME_STANDARD_DEDUCTION = 75000
+HEALTH_EDUCATION_CESS = 0.04
+
+
+def _slab_tax(taxable_income: float, slabs: tuple) -> float:
+    """Slab tax as a sum of rate increments over each threshold, without branching per slab."""
+    return round(
+        sum(rate * max(0, taxable_income - threshold) for threshold, rate in slabs), 2
+    )
+
+
+def _regime_taxes(
+    gross_income: float, total_deductions_old: float
+) -> tuple[float, float, float, float]:
+    """
+    Taxable income and slab tax (before cess) under both regimes.
+
+    Returns:
+        Tuple of (taxable_old, tax_old, taxable_new, tax_new)
+    """
+    taxable_income_old = max(0, gross_income - total_deductions_old)
+    # New regime allows only the standard deduction
+    taxable_income_new = max(0, gross_income - NEW_REGIME_STANDARD_DEDUCTION)
+    return (
+        taxable_income_old,
+        _slab_tax(taxable_income_old, OLD_REGIME_SLABS),
+        taxable_income_new,
+        _slab_tax(taxable_income_new, NEW_REGIME_SLABS),
+    )
+
+
 @tool
 def compare_tax_regimes(
     gross_income: float,
@@ -725,36 +953,9 @@ def compare_tax_regimes(
     Returns:
         Dictionary comparing both tax regimes
     """
-
-    # Old regime tax slabs (FY 2024-25)
-    def calculate_old_regime_tax(taxable_income: float) -> float:
-        if taxable_income <= 250000:
-            return 0
-        elif taxable_income <= 500000:
-            return (taxable_income - 250000) * 0.05
-        elif taxable_income <= 1000000:
-            return 12500 + (taxable_income - 500000) * 0.20
-        else:
-            return 112500 + (taxable_income - 1000000) * 0.30
-
-    # New regime tax slabs (FY 2024-25)
-    def calculate_new_regime_tax(taxable_income: float) -> float:
-        if taxable_income <= 300000:
-            return 0
-        elif taxable_income <= 700000:
-            return (taxable_income - 300000) * 0.05
-        elif taxable_income <= 1000000:
-            return 20000 + (taxable_income - 700000) * 0.10
-        elif taxable_income <= 1200000:
-            return 50000 + (taxable_income - 1000000) * 0.15
-        elif taxable_income <= 1500000:
-            return 80000 + (taxable_income - 1200000) * 0.20
-        else:
-            return 140000 + (taxable_income - 1500000) * 0.30
-
     # Old regime calculations
     # Cap Section 24 interest at ₹2,00,000 for self-occupied property
-    section_24_eligible = min(section_24_interest, 200000)
+    section_24_eligible = min(section_24_interest, SECTION_24_SELF_OCCUPIED_LIMIT)
 
     total_deductions_old = (
         section_80c
@@ -766,20 +967,17 @@ def compare_tax_regimes(
         + standard_deduction
         + other_deductions
     )
-    taxable_income_old = max(0, gross_income - total_deductions_old)
-    tax_old = calculate_old_regime_tax(taxable_income_old)
-
-    # New regime - only standard deduction of ₹75,000 allowed
-    standard_deduction_new = 75000
-    taxable_income_new = max(0, gross_income - standard_deduction_new)
-    tax_new = calculate_new_regime_tax(taxable_income_new)
+    taxable_income_old, tax_old, taxable_income_new, tax_new = _regime_taxes(
+        gross_income, total_deductions_old
+    )
 
     # Add cess (4%)
-    tax_old_with_cess = tax_old * 1.04
-    tax_new_with_cess = tax_new * 1.04
+    tax_old_with_cess = tax_old * (1 + HEALTH_EDUCATION_CESS)
+    tax_new_with_cess = tax_new * (1 + HEALTH_EDUCATION_CESS)
 
+    # Positive when the new regime costs less
     savings = tax_old_with_cess - tax_new_with_cess
-    recommended = "new_regime" if savings < 0 else "old_regime"
+    recommended = "new_regime" if savings > 0 else "old_regime"
 
     return {
         "gross_income": gross_income,
@@ -800,17 +998,86 @@ def compare_tax_regimes(
             "tax_with_cess": round(tax_old_with_cess, 2),
         },
         "new_regime": {
-            "standard_deduction": standard_deduction_new,
+            "standard_deduction": NEW_REGIME_STANDARD_DEDUCTION,
             "taxable_income": taxable_income_new,
             "tax_before_cess": tax_new,
             "tax_with_cess": round(tax_new_with_cess, 2),
         },
-        "savings_with_new_regime": round(-savings, 2),
+        "savings_with_new_regime": round(savings, 2),
         "recommended_regime": recommended,
-        "recommendation_reason": f"You save ₹{abs(round(savings, 2))} with {recommended.replace('_', ' ')}",
+        "recommendation_reason": f"You save {_fmt_inr(abs(savings))} with {recommended.replace('_', ' ')}",
     }
 
 
+@tool
+def compare_tax_regimes_sweep(
+    gross_income: float,
+    deduction_levels: List[float],
+) -> dict:
+    """
+    Compare Old vs New Tax Regime across several old-regime deduction totals at once.
+
+    Use this for "how much do I need to claim for the old regime to win?"
+    questions instead of calling compare_tax_regimes once per scenario.
+
+    Args:
+        gross_income: Gross annual income
+        deduction_levels: Total old-regime deductions to try, each including the
+                          ₹50,000 standard deduction, HRA, 80C, 80D, Section 24, etc.
+                          (e.g. [200000, 300000, 400000, 500000])
+
+    Returns:
+        Dictionary with tax under both regimes for each deduction level and the
+        smallest tried level at which the old regime is cheaper
+    """
+    if not deduction_levels:
+        return {"error": "Provide at least one deduction level"}
+
+    try:
+        import numpy as np
+
+        deductions = np.asarray(deduction_levels, dtype=np.float64)
+        taxable_old = np.maximum(0, gross_income - deductions)
+        tax_old = np.round(
+            sum(
+                rate * np.maximum(0, taxable_old - threshold)
+                for threshold, rate in OLD_REGIME_SLABS
+            ),
+            2,
+        ) * (1 + HEALTH_EDUCATION_CESS)
+
+        # New regime tax does not depend on deductions
+        _, _, _, tax_new = _regime_taxes(gross_income, 0)
+        tax_new_with_cess = tax_new * (1 + HEALTH_EDUCATION_CESS)
+
+        old_is_better = tax_old < tax_new_with_cess
+        breakeven = (
+            float(deductions[old_is_better].min()) if old_is_better.any() else None
+        )
+
+        return {
+            "gross_income": gross_income,
+            "new_regime_tax_with_cess": round(tax_new_with_cess, 2),
+            "scenarios": [
+                {
+                    "total_deductions": float(level),
+                    "old_regime_tax_with_cess": round(float(old), 2),
+                    "savings_with_new_regime": round(float(old) - tax_new_with_cess, 2),
+                    "recommended_regime": "old_regime" if better else "new_regime",
+                }
+                for level, old, better in zip(deductions, tax_old, old_is_better)
+            ],
+            "old_regime_better_from_deductions": breakeven,
+            "note": (
+                f"Old regime is cheaper from {_fmt_inr(breakeven)} of deductions among the levels tried"
+                if breakeven is not None
+                else "New regime is cheaper at every deduction level tried"
+            ),
+        }
+    except ImportError:
+        return {"error": "numpy is required for regime sweeps. Install with: pip install numpy"}
+
+
 @tool
 def calculate_buy_vs_rent(
     property_value: float,
@@ -842,18 +1109,7 @@ def calculate_buy_vs_rent(
     loan_amount = property_value - down_payment
 
     # EMI calculation
-    monthly_rate = interest_rate / 12 / 100
-    num_payments = loan_tenure_years * 12
-
-    if monthly_rate > 0:
-        emi = (
-            loan_amount
-            * monthly_rate
-            * ((1 + monthly_rate) ** num_payments)
-            / (((1 + monthly_rate) ** num_payments) - 1)
-        )
-    else:
-        emi = loan_amount / num_payments
+    emi = loan_emi(loan_amount, interest_rate / 12 / 100, loan_tenure_years * 12)
 
     # Total cost of buying over comparison period
     total_emi_paid = emi * 12 * years_to_compare
@@ -861,12 +1117,14 @@ def calculate_buy_vs_rent(
         (1 + annual_property_appreciation / 100) ** years_to_compare
     )
 
-    # Total rent paid over comparison period
-    total_rent = 0
-    current_rent = monthly_rent
-    for year in range(years_to_compare):
-        total_rent += current_rent * 12
-        current_rent *= 1 + annual_rent_increase / 100
+    # Total rent paid over comparison period (geometric series of annual rent)
+    rent_growth = annual_rent_increase / 100
+    rent_growth_factor = (1 + rent_growth) ** years_to_compare
+    if rent_growth == 0:
+        total_rent = monthly_rent * 12 * years_to_compare
+    else:
+        total_rent = monthly_rent * 12 * (rent_growth_factor - 1) / rent_growth
+    current_rent = monthly_rent * rent_growth_factor
 
     # Net cost comparison
     buy_cost = down_payment + total_emi_paid - (property_value_future - property_value)
@@ -881,21 +1139,120 @@ def calculate_buy_vs_rent(
         "monthly_emi": round(emi, 2),
         "current_monthly_rent": monthly_rent,
         "comparison_period_years": years_to_compare,
-        "buying": {
-            "total_emi_paid": round(total_emi_paid, 2),
-            "property_value_after_period": round(property_value_future, 2),
-            "net_cost": round(buy_cost, 2),
-        },
-        "renting": {
-            "total_rent_paid": round(total_rent, 2),
-            "final_monthly_rent": round(current_rent, 2),
-            "net_cost": round(rent_cost, 2),
-        },
+        "buying": _r2(
+            {
+                "total_emi_paid": total_emi_paid,
+                "property_value_after_period": property_value_future,
+                "net_cost": buy_cost,
+            }
+        ),
+        "renting": _r2(
+            {
+                "total_rent_paid": total_rent,
+                "final_monthly_rent": current_rent,
+                "net_cost": rent_cost,
+            }
+        ),
         "better_option": better_option,
         "savings": round(abs(buy_cost - rent_cost), 2),
     }
 
 
+@tool
+def calculate_buy_vs_rent_sweep(
+    property_value: float,
+    monthly_rent: float,
+    years_to_compare: List[int],
+    down_payment_pct: float = 20,
+    loan_tenure_years: int = 20,
+    interest_rate: float = 8.5,
+    annual_rent_increase: float = 5,
+    annual_property_appreciation: float = 6,
+) -> dict:
+    """
+    Calculate Buy vs Rent over several comparison horizons at once.
+
+    Use this for "does buying pay off after 5, 10 or 15 years?" questions
+    instead of calling calculate_buy_vs_rent once per horizon.
+
+    Args:
+        property_value: Property value in INR
+        monthly_rent: Current monthly rent
+        years_to_compare: Comparison periods in years (e.g. [5, 10, 15, 20])
+        down_payment_pct: Down payment percentage (default 20%)
+        loan_tenure_years: Home loan tenure in years
+        interest_rate: Annual interest rate on home loan
+        annual_rent_increase: Expected annual rent increase percentage
+        annual_property_appreciation: Expected annual property appreciation
+
+    Returns:
+        Dictionary with buy and rent net cost for each horizon and the shortest
+        tried horizon from which buying is cheaper
+    """
+    if not years_to_compare:
+        return {"error": "Provide at least one comparison period"}
+
+    try:
+        import numpy as np
+
+        down_payment = property_value * (down_payment_pct / 100)
+        loan_amount = property_value - down_payment
+        emi = loan_emi(loan_amount, interest_rate / 12 / 100, loan_tenure_years * 12)
+
+        years = np.asarray(years_to_compare, dtype=np.float64)
+        total_emi_paid = emi * 12 * years
+        property_value_future = property_value * (
+            (1 + annual_property_appreciation / 100) ** years
+        )
+
+        rent_growth = annual_rent_increase / 100
+        if rent_growth == 0:
+            total_rent = monthly_rent * 12 * years
+        else:
+            total_rent = monthly_rent * 12 * np.expm1(years * np.log1p(rent_growth)) / rent_growth
+
+        buy_cost = down_payment + total_emi_paid - (property_value_future - property_value)
+        buy_is_better = buy_cost < total_rent
+        breakeven = int(years[buy_is_better].min()) if buy_is_better.any() else None
+
+        return {
+            "property_value": property_value,
+            "down_payment": round(down_payment, 2),
+            "loan_amount": round(loan_amount, 2),
+            "monthly_emi": round(emi, 2),
+            "current_monthly_rent": monthly_rent,
+            "scenarios": [
+                {
+                    "comparison_period_years": int(period),
+                    "buy_net_cost": round(float(buy), 2),
+                    "rent_net_cost": round(float(rent), 2),
+                    "better_option": "buy" if better else "rent",
+                }
+                for period, buy, rent, better in zip(years, buy_cost, total_rent, buy_is_better)
+            ],
+            "buying_better_from_years": breakeven,
+            "note": (
+                f"Buying is cheaper from {breakeven} years among the periods tried"
+                if breakeven is not None
+                else "Renting is cheaper for every period tried"
+            ),
+        }
+    except ImportError:
+        return {"error": "numpy is required for buy vs rent sweeps. Install with: pip install numpy"}
+
+
+# Home loan assumed for affordability estimates, and the loan amount one rupee
+# of monthly EMI services under it
+HOME_LOAN_ASSUMED_RATE = 8.5
+HOME_LOAN_ASSUMED_TENURE_YEARS = 20
+_HOME_LOAN_ANNUITY_FACTOR = loan_for_emi(
+    1, HOME_LOAN_ASSUMED_RATE / 12 / 100, HOME_LOAN_ASSUMED_TENURE_YEARS * 12
+)
+
+# Home EMI headroom below this share of income is flagged as "tight"
+COMFORTABLE_HOME_EMI_RATIO = 0.30
+
+
 @tool
 def calculate_affordable_emi(
     monthly_income: float,
@@ -919,25 +1276,13 @@ def calculate_affordable_emi(
     if available_for_home_emi < 0:
         available_for_home_emi = 0
         status = "over_leveraged"
-    elif available_for_home_emi < monthly_income * 0.30:
+    elif available_for_home_emi < monthly_income * COMFORTABLE_HOME_EMI_RATIO:
         status = "tight"
     else:
         status = "comfortable"
 
     # Estimate loan amount (assuming 8.5% interest, 20 year tenure)
-    interest_rate = 8.5
-    tenure_years = 20
-    monthly_rate = interest_rate / 12 / 100
-    num_payments = tenure_years * 12
-
-    if available_for_home_emi > 0:
-        loan_amount = (
-            available_for_home_emi
-            * (((1 + monthly_rate) ** num_payments) - 1)
-            / (monthly_rate * ((1 + monthly_rate) ** num_payments))
-        )
-    else:
-        loan_amount = 0
+    loan_amount = available_for_home_emi * _HOME_LOAN_ANNUITY_FACTOR
 
     return {
         "monthly_income": monthly_income,
@@ -957,26 +1302,12 @@ def calculate_affordable_emi(
 
 
 # =============================================================================
-# AGENT DEFINITIONS
+# AGENT PROMPTS
 # =============================================================================
 
+_GENERAL_FINANCE_DESCRIPTION: Final[str] = "A comprehensive financial planning specialist covering overall financial stability, insurance, emergency funds, spending analysis, budgeting, home planning, retirement planning, and EPF/VPF calculations. Use this agent for: analyzing financial stability, recommending life insurance coverage (10-20x income rule), calculating emergency fund size (3-6-12 month rule), analyzing spending vs investment ratio (50-30-20 rule), benchmarking spending against demographics, buy vs rent analysis, calculating affordable home loan EMI (FOIR rule), planning retirement corpus, or calculating EPF/VPF returns. Ideal for queries like 'How much emergency fund do I need?', 'Am I spending too much?', 'Should I buy or rent?', 'Can I afford this home loan?', 'How much insurance do I need?', 'Plan my retirement', or 'Calculate EPF maturity'."
 
-def get_agents() -> List[Agent]:
-    """
-    Create and return all Personal Finance Team agents.
-    Consolidated from 4 agents to 2 for improved efficiency.
-
-    Returns:
-        List of configured Agent instances
-    """
-    llm = get_llm(model="gpt-5-nano", provider="openai")
-
-    # 1. General Finance & Lifestyle Advisor (Consolidated: General Finance + Spending + Home Planning)
-    general_finance_lifestyle_agent = Agent(
-        name="General Finance & Lifestyle Advisor",
-        role="Holistic Financial Planning & Lifestyle Specialist",
-        description="A comprehensive financial planning specialist covering overall financial stability, insurance, emergency funds, spending analysis, budgeting, home planning, retirement planning, and EPF/VPF calculations. Use this agent for: analyzing financial stability, recommending life insurance coverage (10-20x income rule), calculating emergency fund size (3-6-12 month rule), analyzing spending vs investment ratio (50-30-20 rule), benchmarking spending against demographics, buy vs rent analysis, calculating affordable home loan EMI (FOIR rule), planning retirement corpus, or calculating EPF/VPF returns. Ideal for queries like 'How much emergency fund do I need?', 'Am I spending too much?', 'Should I buy or rent?', 'Can I afford this home loan?', 'How much insurance do I need?', 'Plan my retirement', or 'Calculate EPF maturity'.",
-        instructions="""You are a comprehensive financial planning and lifestyle specialist for Indian users. Your role encompasses:
+_GENERAL_FINANCE_INSTRUCTIONS: Final[str] = """You are a comprehensive financial planning and lifestyle specialist for Indian users. Your role encompasses:
 
 FINANCIAL STABILITY & PROTECTION:
 1. Analyze overall financial health and stability
@@ -986,14 +1317,14 @@ FINANCIAL STABILITY & PROTECTION:
 
 SPENDING ANALYSIS & BUDGETING:
 1. Analyze monthly spending data and cross-reference with income
-2. Perform spending vs investment ratio analysis using the 50-30-20 rule (50% needs, 30% wants, 20% savings)
+2. Perform spending vs investment ratio analysis using the 50-30-20 rule (50% needs, 30% wants, 20% savings) (use analyze_spending_ratio_batch to compare several months or budgets in one call)
 3. Benchmark spending against user demographics (age group) for categories: dining, entertainment, shopping, transportation, utilities, groceries
 4. Identify areas of overspending compared to peer averages
 5. Suggest actionable budget corrections and savings strategies
 6. Provide specific recommendations like "You are spending X% more on dining than the average for your age group"
 
 HOME PLANNING & REAL ESTATE:
-1. Analyze Buy vs Rent scenarios based on market rates, user liquidity, and opportunity cost
+1. Analyze Buy vs Rent scenarios based on market rates, user liquidity, and opportunity cost (use calculate_buy_vs_rent_sweep to compare several holding periods in one call)
 2. Calculate affordable Home Loan EMI limits using FOIR (Fixed Obligation to Income Ratio)
 3. Ensure users don't become "house poor" by over-committing to EMIs
 4. Consider property appreciation (typically 5-8%), rent inflation, maintenance costs, and registration fees
@@ -1034,33 +1365,11 @@ FINANCIAL RULES TO REMEMBER:
 - FOIR Rule: Total EMIs ≤ 40-50% of monthly income
 - 100-Age Rule (or 110/120 for aggressive): Basic asset allocation guideline
 
-Always provide balanced advice considering user's life stage, risk tolerance, and financial goals.""",
-        model=llm,
-        tools=[
-            # Insurance & Emergency Fund
-            calculate_life_insurance_coverage,
-            calculate_emergency_fund,
-            # Spending Analysis
-            analyze_spending_ratio,
-            get_spending_benchmarks,
-            # Home Planning
-            calculate_buy_vs_rent,
-            calculate_affordable_emi,
-            calculate_section_24_interest,
-            # Retirement & EPF/VPF
-            calculate_epf_vpf_returns,
-            calculate_retirement_corpus,
-            # Web search for latest info
-            SerperTools(location="in"),
-        ],
-    )
+Always provide balanced advice considering user's life stage, risk tolerance, and financial goals."""
 
-    # 2. Tax & Compliance Specialist (Enhanced Tax Planning Assistant)
-    tax_compliance_specialist = Agent(
-        name="Tax & Compliance Specialist",
-        role="Indian Tax Optimization & Compliance Expert",
-        description="A tax planning and compliance specialist with deep knowledge of Indian Income Tax rules. Use this agent for: calculating HRA exemption, Section 80C deductions (PPF/ELSS/Insurance/EPF), Section 80D deductions (health insurance premiums), Section 80CCD deductions (NPS contributions), Section 24 deductions (home loan interest), LTA exemption, capital gains tax on investments, comparing old vs new tax regimes, or optimizing salary structure. Ideal for queries like 'How much tax can I save?', 'Old vs new tax regime?', 'Calculate my HRA exemption', 'What are my Section 80C options?', 'Capital gains tax on stocks', 'How to optimize my salary?', or 'Tax-saving investment recommendations'.",
-        instructions="""You are a tax planning and compliance specialist with deep knowledge of Indian Income Tax rules. Your role is to:
+_TAX_COMPLIANCE_DESCRIPTION: Final[str] = "A tax planning and compliance specialist with deep knowledge of Indian Income Tax rules. Use this agent for: calculating HRA exemption, Section 80C deductions (PPF/ELSS/Insurance/EPF), Section 80D deductions (health insurance premiums), Section 80CCD deductions (NPS contributions), Section 24 deductions (home loan interest), LTA exemption, capital gains tax on investments, comparing old vs new tax regimes, or optimizing salary structure. Ideal for queries like 'How much tax can I save?', 'Old vs new tax regime?', 'Calculate my HRA exemption', 'What are my Section 80C options?', 'Capital gains tax on stocks', 'How to optimize my salary?', or 'Tax-saving investment recommendations'."
+
+_TAX_COMPLIANCE_INSTRUCTIONS: Final[str] = """You are a tax planning and compliance specialist with deep knowledge of Indian Income Tax rules. Your role is to:
 
 TAX DEDUCTIONS & EXEMPTIONS:
 1. Calculate HRA (House Rent Allowance) exemption for salaried employees
@@ -1105,7 +1414,7 @@ New Regime (FY 2024-25):
 
 APPROACH:
 1. Ask for all relevant details: gross income, basic salary, HRA received, rent paid, investments, home loan interest
-2. Calculate both old and new regime tax liabilities
+2. Calculate both old and new regime tax liabilities (use compare_tax_regimes_sweep to find how much deduction makes the old regime worthwhile)
 3. Recommend the regime with lower tax burden
 4. Suggest tax-saving strategies within legal limits
 5. Explain tax implications clearly with specific numbers
@@ -1136,54 +1445,17 @@ IMPORTANT PRINCIPLES:
 - Stay updated with latest tax amendments
 - Encourage users to consult certified tax advisors for complex scenarios
 
-Always provide specific numbers, clear explanations, and actionable next steps.""",
-        model=llm,
-        tools=[
-            # Salary Components & Exemptions
-            calculate_hra_exemption,
-            calculate_lta_exemption,
-            # Section 80 Deductions
-            calculate_section_80c_deductions,
-            calculate_section_80d_deductions,
-            calculate_nps_deduction_80ccd,
-            # Home Loan Benefits
-            calculate_section_24_interest,
-            # Capital Gains Tax (imported from investment_team)
-            calculate_capital_gains_tax,
-            # Tax Regime Comparison
-            compare_tax_regimes,
-            # Web search for latest tax updates
-            SerperTools(location="in"),
-        ],
-        knowledge=knowledge_base,
-        search_knowledge=True,
-        knowledge_filters={"type": "income_tax_documents"},
-    )
-
-    return [
-        general_finance_lifestyle_agent,
-        tax_compliance_specialist,
-    ]
-
-
-def get_teams() -> List[Team]:
-    """
-    Create and return the Personal Finance Team.
-    Consolidated from 4 agents to 2 for improved efficiency.
+Always provide specific numbers, clear explanations, and actionable next steps."""
 
-    Returns:
-        Configured Team instance
-    """
-    personal_finance_team = Team(
-        name="Personal Finance Team",
-        description="""A comprehensive personal finance team providing financial foundation, tax optimization, and lifestyle planning for Indian users.
+_PERSONAL_FINANCE_TEAM_DESCRIPTION: Final[str] = """A comprehensive personal finance team providing financial foundation, tax optimization, and lifestyle planning for Indian users.
 
 This team has been optimized from 4 agents to 2 specialized agents for improved efficiency:
 1. General Finance & Lifestyle Advisor - Financial stability, insurance, emergency funds, spending analysis, home planning, retirement
 2. Tax & Compliance Specialist - Tax optimization, deductions, regime comparison, capital gains
 
-Use this team for: analyzing financial stability, recommending life insurance coverage (10-20x income rule), calculating emergency fund size (3-6-12 month rule), analyzing spending patterns and budgeting (50-30-20 rule), benchmarking spending against demographics, buy vs rent analysis, calculating affordable home loan EMI (FOIR rule), planning retirement corpus, calculating EPF/VPF returns, calculating HRA exemption, Section 80C/80D/80CCD deductions, comparing old vs new tax regimes, capital gains tax calculations, or optimizing salary structure. The team provides comprehensive personal finance guidance covering both financial planning and tax compliance.""",
-        instructions="""You are a team of personal finance experts specializing in financial foundation, tax optimization, and lifestyle planning for Indian users.
+Use this team for: analyzing financial stability, recommending life insurance coverage (10-20x income rule), calculating emergency fund size (3-6-12 month rule), analyzing spending patterns and budgeting (50-30-20 rule), benchmarking spending against demographics, buy vs rent analysis, calculating affordable home loan EMI (FOIR rule), planning retirement corpus, calculating EPF/VPF returns, calculating HRA exemption, Section 80C/80D/80CCD deductions, comparing old vs new tax regimes, capital gains tax calculations, or optimizing salary structure. The team provides comprehensive personal finance guidance covering both financial planning and tax compliance."""
+
+_PERSONAL_FINANCE_TEAM_INSTRUCTIONS: Final[str] = """You are a team of personal finance experts specializing in financial foundation, tax optimization, and lifestyle planning for Indian users.
 
 Your team has been optimized to 2 specialized agents:
 
@@ -1238,13 +1510,129 @@ APPROACH:
 4. Provide integrated advice considering user's complete financial picture
 5. Always ask for missing information rather than making assumptions
 
-Encourage users to consult certified financial advisors for personalized advice.""",
-        members=get_agents(),
+Encourage users to consult certified financial advisors for personalized advice."""
+
+
+# =============================================================================
+# AGENT DEFINITIONS
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def get_agents() -> List["Agent"]:
+    """
+    Create and return all Personal Finance Team agents.
+    Consolidated from 4 agents to 2 for improved efficiency.
+
+    Built once per process and cached, like the Investment Helper Team's agents.
+
+    Returns:
+        List of configured Agent instances
+    """
+    from agno.agent import Agent
+
+    from core.serper import SerperTools
+
+    llm = get_llm(model="gpt-5-nano", provider="openai")
+    # One search toolkit shared by both agents
+    serper_tools = SerperTools(location="in")
+
+    # 1. General Finance & Lifestyle Advisor (Consolidated: General Finance + Spending + Home Planning)
+    general_finance_lifestyle_agent = Agent(
+        name="General Finance & Lifestyle Advisor",
+        role="Holistic Financial Planning & Lifestyle Specialist",
+        description=_GENERAL_FINANCE_DESCRIPTION,
+        instructions=_GENERAL_FINANCE_INSTRUCTIONS,
+        model=llm,
+        tools=[
+            # Insurance & Emergency Fund
+            calculate_life_insurance_coverage,
+            calculate_emergency_fund,
+            # Spending Analysis
+            analyze_spending_ratio,
+            analyze_spending_ratio_batch,
+            get_spending_benchmarks,
+            # Home Planning
+            calculate_buy_vs_rent,
+            calculate_buy_vs_rent_sweep,
+            calculate_affordable_emi,
+            calculate_section_24_interest,
+            # Retirement & EPF/VPF
+            calculate_epf_vpf_returns,
+            calculate_retirement_corpus,
+            # Web search for latest info
+            serper_tools,
+        ],
+    )
+
+    # 2. Tax & Compliance Specialist (Enhanced Tax Planning Assistant)
+    tax_compliance_specialist = Agent(
+        name="Tax & Compliance Specialist",
+        role="Indian Tax Optimization & Compliance Expert",
+        description=_TAX_COMPLIANCE_DESCRIPTION,
+        instructions=_TAX_COMPLIANCE_INSTRUCTIONS,
+        model=llm,
+        tools=[
+            # Salary Components & Exemptions
+            calculate_hra_exemption,
+            calculate_lta_exemption,
+            # Section 80 Deductions
+            calculate_section_80c_deductions,
+            calculate_section_80d_deductions,
+            calculate_nps_deduction_80ccd,
+            # Home Loan Benefits
+            calculate_section_24_interest,
+            # Capital Gains Tax (imported from investment_team)
+            calculate_capital_gains_tax,
+            # Tax Regime Comparison
+            compare_tax_regimes,
+            compare_tax_regimes_sweep,
+            # Web search for latest tax updates
+            serper_tools,
+        ],
+        knowledge=get_knowledge_base(),
+        search_knowledge=True,
+        knowledge_filters={"type": "income_tax_documents"},
+    )
+
+    agents = [
+        general_finance_lifestyle_agent,
+        tax_compliance_specialist,
+    ]
+    prepare_tools(agents)
+    return agents
+
+
+@lru_cache(maxsize=1)
+def get_teams() -> List["Team"]:
+    """
+    Create and return the Personal Finance Team.
+    Consolidated from 4 agents to 2 for improved efficiency.
+
+    Built once per process and cached: agents and teams hold configuration
+    only, while per-run state lives in agno's run context and session storage.
+
+    Returns:
+        Configured Team instance
+    """
+    from agno.team import Team
+
+    personal_finance_team = Team(
+        name="Personal Finance Team",
+        description=_PERSONAL_FINANCE_TEAM_DESCRIPTION,
+        instructions=_PERSONAL_FINANCE_TEAM_INSTRUCTIONS,
+        members=get_agents.__wrapped__(),
         model=get_llm(model="gpt-5-nano", provider="openai"),
         markdown=True,
-        knowledge=knowledge_base,
+        knowledge=get_knowledge_base(),
         search_knowledge=True,
         knowledge_filters={"type": "personal_financing_documents"},
     )
 
     return [personal_finance_team]
+
+
+def reset_teams() -> None:
+    """Drop the cached Personal Finance Team and agents so the next calls rebuild them."""
+    get_agents.cache_clear()
+    get_teams.cache_clear()
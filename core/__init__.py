@@ -2,6 +2,23 @@
 Core module for FinAgent application.
 """
 
-from .loader import load_all_agents_and_teams, create_agent_os, run_agent_os
+__all__ = [
+    "load_all_agents_and_teams",
+    "create_agent_os",
+    "run_agent_os",
+    "reset_registry",
+]
 
-__all__ = ["load_all_agents_and_teams", "create_agent_os", "run_agent_os"]
+
+def __getattr__(name: str):
+    # Resolve the loader only on first use, so importing a core submodule
+    # (e.g. core.llm from an agent module) does not pull in the loader
+    if name in __all__:
+        from . import loader
+
+        return getattr(loader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
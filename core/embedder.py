@@ -0,0 +1,55 @@
+"""
+Batch-capable sentence-transformer embedder for the FinAgent knowledge base.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.knowledge.embedder.sentence_transformer import SentenceTransformerEmbedder
+
+
+@dataclass
+class BatchSentenceTransformerEmbedder(SentenceTransformerEmbedder):
+    """
+    SentenceTransformerEmbedder that encodes many chunks per model call.
+
+    agno's vector DBs only batch embeddings when the embedder exposes
+    `async_get_embeddings_batch_and_usage`; without it every chunk is
+    encoded on its own. Ingest with `Knowledge.add_content_async()` to use
+    the batched path. Single-query search embedding is unchanged.
+    """
+
+    enable_batch: bool = True
+    batch_size: int = 128
+
+    def get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Embed a list of texts in batches of `batch_size`.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Tuple of (embedding vectors, per-text usage which is always None)
+        """
+        if self.sentence_transformer_client is None:
+            raise RuntimeError("SentenceTransformer model not initialized")
+
+        embeddings = self.sentence_transformer_client.encode(
+            texts,
+            prompt=self.prompt,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=self.normalize_embeddings,
+            show_progress_bar=False,
+        )
+        return embeddings.tolist(), [None] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version that runs the CPU-bound encoding in a worker thread."""
+        return await asyncio.to_thread(self.get_embeddings_batch_and_usage, texts)
@@ -0,0 +1,58 @@
+"""
+Loan and annuity arithmetic shared by the FinAgent calculator tools.
+"""
+
+import math
+
+
+def _growth(monthly_rate: float, num_payments: int) -> tuple[float, float]:
+    """
+    Return ((1 + r)^n, (1 + r)^n - 1).
+
+    Both come from n × log1p(r), and the second uses expm1, so the annuity
+    denominator keeps its precision even at very small rates.
+    """
+    log_growth = num_payments * math.log1p(monthly_rate)
+    return math.exp(log_growth), math.expm1(log_growth)
+
+
+def emi(principal: float, monthly_rate: float, num_payments: int) -> float:
+    """
+    Equated monthly instalment that repays a loan.
+
+    EMI = P × r × (1 + r)^n / ((1 + r)^n - 1), or P / n at zero interest
+
+    Args:
+        principal: Loan amount
+        monthly_rate: Monthly interest rate as a fraction (annual % / 12 / 100)
+        num_payments: Number of monthly instalments
+
+    Returns:
+        Monthly instalment
+    """
+    if monthly_rate <= 0:
+        return principal / num_payments
+
+    growth, growth_minus_one = _growth(monthly_rate, num_payments)
+    return principal * monthly_rate * growth / growth_minus_one
+
+
+def loan_for_emi(monthly_emi: float, monthly_rate: float, num_payments: int) -> float:
+    """
+    Loan amount that a monthly instalment can service (inverse of `emi`).
+
+    P = EMI × ((1 + r)^n - 1) / (r × (1 + r)^n), or EMI × n at zero interest
+
+    Args:
+        monthly_emi: Monthly instalment
+        monthly_rate: Monthly interest rate as a fraction (annual % / 12 / 100)
+        num_payments: Number of monthly instalments
+
+    Returns:
+        Loan amount
+    """
+    if monthly_rate <= 0:
+        return monthly_emi * num_payments
+
+    growth, growth_minus_one = _growth(monthly_rate, num_payments)
+    return monthly_emi * growth_minus_one / (monthly_rate * growth)
@@ -0,0 +1,31 @@
+"""
+OpenAI-compatible model that authenticates each request with a fresh IAM header.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from agno.models.openai import OpenAILike
+
+
+@dataclass
+class IAMOpenAILike(OpenAILike):
+    """
+    OpenAILike whose Authorization header is looked up per request.
+
+    get_llm() caches model instances and the agent and team factories cache
+    the agents holding them, so a header fixed at construction would outlive
+    the IAM token's TTL. `auth_header` is called when each request is built
+    instead, and returns the currently cached (or freshly fetched) token.
+    """
+
+    auth_header: Optional[Callable[[], str]] = None
+
+    def get_request_params(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        request_params = super().get_request_params(*args, **kwargs)
+        if self.auth_header is not None:
+            request_params["extra_headers"] = {
+                **(request_params.get("extra_headers") or {}),
+                "Authorization": self.auth_header(),
+            }
+        return request_params
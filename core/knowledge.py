@@ -0,0 +1,124 @@
+"""
+Knowledge base with memoized searches for the FinAgent document store.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, List, Optional, Tuple
+
+from agno.knowledge import Knowledge
+from agno.knowledge.document import Document
+
+
+def _filters_key(filters: Any) -> Optional[Hashable]:
+    """
+    Hashable form of search filters, or None if they cannot be cached.
+
+    Plain {"type": "..."} dicts (what the agents pass) are cacheable;
+    FilterExpr lists and unhashable values fall through to a live search.
+    """
+    if filters is None:
+        return ()
+    if not isinstance(filters, dict):
+        return None
+    key = tuple(sorted(filters.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@dataclass
+class CachedKnowledge(Knowledge):
+    """
+    Knowledge that remembers recent search results per (query, filters).
+
+    The financial documents rarely change while the app runs, yet every agent
+    turn re-embeds the query and re-queries the vector DB. Results are kept
+    for `search_cache_ttl` seconds in an LRU of `search_cache_size` entries.
+    Call `clear_search_cache()` after adding or removing documents to see
+    them straight away. Empty results are not cached, since a failed search
+    also returns an empty list.
+    """
+
+    search_cache_size: int = 512
+    search_cache_ttl: float = 300.0
+    _search_cache: "OrderedDict[Tuple, Tuple[float, List[Document]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _search_cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def clear_search_cache(self) -> None:
+        """Drop all memoized search results."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+
+    def _cache_key(
+        self,
+        query: str,
+        max_results: Optional[int],
+        filters: Any,
+        search_type: Optional[str],
+    ) -> Optional[Tuple]:
+        filters_key = _filters_key(filters)
+        if filters_key is None:
+            return None
+        return (query, max_results or self.max_results, filters_key, search_type)
+
+    def _cache_get(self, key: Optional[Tuple]) -> Optional[List[Document]]:
+        if key is None:
+            return None
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, documents = entry
+            if time.monotonic() - stored_at > self.search_cache_ttl:
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return list(documents)
+
+    def _cache_put(self, key: Optional[Tuple], documents: List[Document]) -> None:
+        if key is None or not documents:
+            return
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.monotonic(), list(documents))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+
+    def search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        filters: Any = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        """Search the knowledge base, reusing a recent identical search if any."""
+        key = self._cache_key(query, max_results, filters, search_type)
+        documents = self._cache_get(key)
+        if documents is None:
+            documents = super().search(query, max_results, filters, search_type)
+            self._cache_put(key, documents)
+        return documents
+
+    async def async_search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        filters: Any = None,
+        search_type: Optional[str] = None,
+    ) -> List[Document]:
+        """Async version of `search`."""
+        key = self._cache_key(query, max_results, filters, search_type)
+        documents = self._cache_get(key)
+        if documents is None:
+            documents = await super().async_search(query, max_results, filters, search_type)
+            self._cache_put(key, documents)
+        return documents
@@ -0,0 +1,37 @@
+"""
+Per-upstream concurrency limits for FinAgent's network-bound tools.
+"""
+
+import threading
+from typing import Dict
+
+# Maximum in-flight calls per upstream service, to stay within rate limits
+UPSTREAM_CONCURRENCY: Dict[str, int] = {
+    "yfinance": 10,
+    "serper": 10,
+}
+
+# Tools stay synchronous (agno runs them in worker threads under arun), so the
+# limiters are thread semaphores, created up front rather than per event loop
+_limits: Dict[str, threading.BoundedSemaphore] = {
+    upstream: threading.BoundedSemaphore(limit)
+    for upstream, limit in UPSTREAM_CONCURRENCY.items()
+}
+
+
+def upstream_limit(upstream: str) -> threading.BoundedSemaphore:
+    """
+    Get the concurrency limiter for an upstream.
+
+    Use it around the blocking call itself:
+
+        with upstream_limit("yfinance"):
+            hist = ticker.history(period="1mo")
+
+    Args:
+        upstream: Upstream service name, a key of UPSTREAM_CONCURRENCY
+
+    Returns:
+        Bounded semaphore shared by every caller of that upstream
+    """
+    return _limits[upstream]
@@ -2,30 +2,65 @@
 LLM configuration and authentication for FinAgent.
 """
 
+from functools import lru_cache
 from typing import Any
+import logging
+import threading
+import time
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from settings import get_settings
 
-_cached_token: str | None = None
+logger = logging.getLogger(__name__)
+
+# IAM authorization headers are re-fetched once per window of this length
+AUTH_TOKEN_TTL_SECONDS = 3600
+
+IAM_URL = "https://identityinternal.api.intuit.com/v1/graphql"
+
+IAM_MUTATION = """mutation identitySignInInternalApplicationWithPrivateAuth($input: Identity_SignInApplicationWithPrivateAuthInput!) {
+    identitySignInInternalApplicationWithPrivateAuth(input: $input) {
+        authorizationHeader
+    }
+}"""
+
+# Keep-alive session for IAM calls. The sign-in mutation is safe to repeat,
+# so POST is retried on transient gateway errors too.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+    ),
+)
+
+
+# Serializes token lookups so concurrent cache misses share one IAM call
+_token_lock = threading.Lock()
 
 
 def _get_auth_token() -> str:
-    """Get cached authentication token or fetch a new one if not available."""
-    global _cached_token
-    if _cached_token:
-        return _cached_token
+    """Get the cached authentication token, fetching a new one once per TTL window."""
+    with _token_lock:
+        return _fetch_auth_token(int(time.time() // AUTH_TOKEN_TTL_SECONDS))
 
-    settings = get_settings()
 
-    # Fetch new token from IAM
-    url = "https://identityinternal.api.intuit.com/v1/graphql"
+@lru_cache(maxsize=1)
+def _fetch_auth_token(ttl_window: int) -> str:
+    """
+    Fetch an authentication token from IAM.
 
-    IAM_MUTATION = """mutation identitySignInInternalApplicationWithPrivateAuth($input: Identity_SignInApplicationWithPrivateAuthInput!) {
-        identitySignInInternalApplicationWithPrivateAuth(input: $input) {
-            authorizationHeader
-        }
-    }"""
+    Cached on the current TTL window index, so a new window (the only key that
+    misses) triggers one refresh and evicts the previous token.
+    """
+    settings = get_settings()
 
     headers = {
         "intuit_tid": str(uuid.uuid4()),
@@ -39,21 +74,22 @@ def _get_auth_token() -> str:
     }
 
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = _session.post(IAM_URL, json=data, headers=headers, timeout=10)
         response.raise_for_status()
         result = response.json()
 
         base_token = result["data"]["identitySignInInternalApplicationWithPrivateAuth"][
             "authorizationHeader"
         ]
-        _cached_token = f"{base_token},intuit_appid={settings.client_app_id},intuit_app_secret={settings.client_app_secret}"
-        print("✓ New auth token obtained and cached")
-        return _cached_token
-    except Exception as e:
-        print(f"✗ Failed to get auth token: {e}")
+        token = f"{base_token},intuit_appid={settings.client_app_id},intuit_app_secret={settings.client_app_secret}"
+        logger.info("New auth token obtained and cached")
+        return token
+    except Exception:
+        logger.exception("Failed to get auth token")
         raise
 
 
+@lru_cache(maxsize=8)
 def get_llm(
     model: str = "amazon.nova-pro-v1-0",
     provider: str = "intuit",
@@ -61,26 +97,32 @@ def get_llm(
     """
     Get configured LLM instance.
 
+    Instances are cached per (model, provider), so every agent and team that
+    asks for the same model shares one client and its connection pool instead
+    of opening a new one per member.
+
     Args:
         model: Model name to use (default: amazon.nova-lite-v1-0)
                Options: amazon.nova-lite-v1-0, anthropic.claude-sonnet-4-20250514-v1-0,
                gpt-5-nano-2025-08-07-oai, gpt-5-chat-2025-08-07-oai
 
     Returns:
-        Configured OpenAILike instance
+        Configured OpenAILike (IAMOpenAILike) or OpenAIResponses instance
     """
     settings = get_settings()
 
     if provider == "intuit":
-        from agno.models.openai import OpenAILike
+        from core.iam_model import IAMOpenAILike
 
-        return OpenAILike(
+        # The Authorization header is resolved per request, so the cached
+        # instance keeps working after the IAM token's TTL window rolls over
+        return IAMOpenAILike(
             base_url=f"https://llmexecution.api.intuit.com/v3/lt/{model}",
             extra_headers={
                 "intuit_experience_id": settings.experience_id,
                 "intuit_originating_assetalias": "Intuit.coe.pecomplianceremediation",
-                "Authorization": _get_auth_token(),
             },
+            auth_header=_get_auth_token,
         )
     elif provider == "openai":
         from agno.models.openai import OpenAIResponses
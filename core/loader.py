@@ -3,15 +3,41 @@ Agent loader module - loads all agents from the agents folder and creates AgentO
 """
 
 import importlib
+import logging
 import pkgutil
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List, Tuple
 
-from agno.team import Team
-from agno.agent import Agent
-from agno.os import AgentOS
+# agno's agent, team and OS modules are imported where they are used, so that
+# importing the core package stays cheap until an AgentOS is actually built
+if TYPE_CHECKING:
+    from agno.team import Team
+    from agno.agent import Agent
+    from agno.os import AgentOS
 
+logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _discover_agent_modnames() -> Tuple[str, ...]:
+    """
+    List the public modules of the agents package.
+
+    The package directory is scanned once per process; later calls reuse the
+    result instead of walking the filesystem again.
+    """
+    import agents as agents_pkg
+
+    return tuple(
+        modname
+        for _, modname, _ in pkgutil.iter_modules(agents_pkg.__path__)
+        if not modname.startswith("_")
+    )
+
+
+@lru_cache(maxsize=1)
 def load_all_agents_and_teams() -> List[Any]:
     """
     Dynamically load all agents from the agents folder.
@@ -20,52 +46,74 @@ def load_all_agents_and_teams() -> List[Any]:
     - a `get_agents()` function that returns a list of Agent instances, and
     - a `get_teams()` function that returns a list of Team instances.
 
+    Loaded once per process; call `reset_registry()` to load again, e.g.
+    between tests.
+
     Returns:
         List of all loaded Agent instances and Team instances
         in the order they were loaded.
     """
-    agents: List[Agent] = []
-    teams: List[Team] = []
-
-    # Import agents package
-    import agents as agents_pkg
+    agents: List["Agent"] = []
+    teams: List["Team"] = []
 
     # Iterate through all modules in the agents package
-    for importer, modname, ispkg in pkgutil.iter_modules(agents_pkg.__path__):
-        if modname.startswith("_"):
-            continue
-
+    for modname in _discover_agent_modnames():
         try:
-            module = importlib.import_module(f"agents.{modname}")
+            # Modules already imported (e.g. by another agent module) skip the
+            # import machinery entirely
+            module = sys.modules.get(f"agents.{modname}") or importlib.import_module(
+                f"agents.{modname}"
+            )
         except Exception as e:
-            print(f"✗ Failed to load agents.{modname}: {e}")
+            logger.error("Failed to load agents.%s: %s", modname, e)
             continue
 
+        # Look the factories up in the module's own namespace, so a module-level
+        # __getattr__ (lazy exports) is never triggered by the probe
+        get_agents = module.__dict__.get("get_agents")
+        get_teams = module.__dict__.get("get_teams")
+
         # Check if module has get_agents function
-        if hasattr(module, "get_agents"):
-            module_agents = module.get_agents()
+        if get_agents is not None:
+            module_agents = get_agents()
             agents.extend(module_agents)
-            print(f"✓ Loaded {len(module_agents)} agents from agents.{modname}")
+            logger.info("Loaded %d agents from agents.%s", len(module_agents), modname)
         else:
-            print(f"⚠ Module agents.{modname} has no get_agents() function")
+            logger.warning("Module agents.%s has no get_agents() function", modname)
 
         # Check if module has get_teams function
-        if hasattr(module, "get_teams"):
-            module_teams = module.get_teams()
+        if get_teams is not None:
+            module_teams = get_teams()
             teams.extend(module_teams)
-            print(f"✓ Loaded {len(module_teams)} teams from agents.{modname}")
+            logger.info("Loaded %d teams from agents.%s", len(module_teams), modname)
         else:
-            print(f"⚠ Module agents.{modname} has no get_teams() function")
+            logger.warning("Module agents.%s has no get_teams() function", modname)
 
     return agents, teams
 
 
+def reset_registry() -> None:
+    """
+    Forget the loaded agents and teams so the next load builds them again.
+
+    Clears the loader and default AgentOS caches and calls `reset_teams()` on
+    every loaded agent module that defines it.
+    """
+    for modname in _discover_agent_modnames():
+        module = sys.modules.get(f"agents.{modname}")
+        if module is not None and hasattr(module, "reset_teams"):
+            module.reset_teams()
+
+    load_all_agents_and_teams.cache_clear()
+    _create_default_agent_os.cache_clear()
+
+
 def create_agent_os(
     os_id: str = "finagent-os",
     description: str = "Financial Advisor Agent OS for Indians",
-    agents: List[Agent] | None = None,
-    teams: List[Team] | None = None,
-) -> AgentOS:
+    agents: List["Agent"] | None = None,
+    teams: List["Team"] | None = None,
+) -> "AgentOS":
     """
     Create an AgentOS instance with all loaded agents.
 
@@ -79,17 +127,19 @@ def create_agent_os(
         Configured AgentOS instance
     """
     if agents is None and teams is None:
-        agents, teams = load_all_agents_and_teams()
+        return _create_default_agent_os(os_id, description)
 
     agents = agents or []
     teams = teams or []
 
     if not agents and not teams:
-        print(
-            "⚠ No agents or teams loaded. AgentOS will be created with empty agent list."
+        logger.warning(
+            "No agents or teams loaded. AgentOS will be created with empty agent list."
         )
     else:
-        print(f"✓ Creating AgentOS with {len(agents)} agents and {len(teams)} teams")
+        logger.info("Creating AgentOS with %d agents and %d teams", len(agents), len(teams))
+
+    from agno.os import AgentOS
 
     return AgentOS(
         id=os_id,
@@ -99,9 +149,16 @@ def create_agent_os(
     )
 
 
+@lru_cache(maxsize=8)
+def _create_default_agent_os(os_id: str, description: str) -> "AgentOS":
+    """AgentOS over every loaded agent and team, built once per (os_id, description)."""
+    agents, teams = load_all_agents_and_teams()
+    return create_agent_os(os_id=os_id, description=description, agents=agents, teams=teams)
+
+
 def run_agent_os(
     port: int = 5111,
-    reload: bool = True,
+    reload: bool = False,
     os_id: str = "finagent-os",
     description: str = "Financial Advisor Agent OS for Indians",
 ) -> None:
@@ -110,12 +167,18 @@ def run_agent_os(
 
     Args:
         port: Port to run the server on
-        reload: Enable hot-reloading
+        reload: Enable hot-reloading (development only; uvicorn then imports
+                the app again in a watcher subprocess)
         os_id: Unique identifier for the AgentOS
         description: Description of the AgentOS
     """
     agent_os = create_agent_os(os_id=os_id, description=description)
-    app = agent_os.get_app()
 
-    # The app reference needs to be in __main__ for reload to work
-    agent_os.serve(app="main:app", reload=reload, port=port)
+    if reload:
+        # The reloader needs an import string; its worker process imports
+        # main:app and builds its own AgentOS
+        agent_os.serve(app="main:app", reload=True, port=port)
+    else:
+        # Serve the app built here rather than having uvicorn import main
+        # and build everything a second time
+        agent_os.serve(app=agent_os.get_app(), port=port)
@@ -0,0 +1,145 @@
+"""
+Serper (Google Search API) toolkit for FinAgent agents.
+
+Unlike agno's SerperTools, searches go through one pooled HTTP client per
+toolkit, are capped by the shared "serper" upstream limit and are served
+from the on-disk Serper cache when a recent identical search exists.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+from agno.tools import Toolkit
+
+from core.limits import upstream_limit
+from core.serper_cache import serper_cached
+
+SERPER_SEARCH_URL = "https://google.serper.dev"
+SERPER_SCRAPE_URL = "https://scrape.serper.dev"
+
+
+class SerperTools(Toolkit):
+    """Google web, news and scholar search plus page scraping via Serper."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        location: str = "us",
+        language: str = "en",
+        num_results: int = 10,
+        date_range: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            api_key: Serper API key (default: SERPER_API_KEY env variable)
+            location: Google country code for results (e.g. 'in')
+            language: Google language code for results
+            num_results: Default number of results per search
+            date_range: Optional Google 'tbs' filter (e.g. 'qdr:d' for past day)
+        """
+        self.api_key = api_key or os.getenv("SERPER_API_KEY")
+        self.location = location
+        self.language = language
+        self.num_results = num_results
+        self.date_range = date_range
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+        super().__init__(
+            name="serper_tools",
+            tools=[
+                self.search_web,
+                self.search_news,
+                self.search_scholar,
+                self.scrape_webpage,
+            ],
+            **kwargs,
+        )
+
+    def _post(self, url: str, payload: Dict[str, Any]) -> str:
+        """POST a Serper request and return the response body as a JSON string."""
+        if not self.api_key:
+            return json.dumps({"error": "SERPER_API_KEY is not set"})
+
+        try:
+            return self._fetch(url, payload)
+        except Exception as e:
+            return json.dumps({"error": f"Serper request failed: {str(e)}"})
+
+    @serper_cached(ttl="1h")
+    def _fetch(self, url: str, payload: Dict[str, Any]) -> str:
+        headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
+        with upstream_limit("serper"):
+            response = self._client.post(url, json=payload, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+    def _search(self, endpoint: str, query: str, num_results: Optional[int]) -> str:
+        payload: Dict[str, Any] = {
+            "q": query,
+            "num": num_results or self.num_results,
+            "gl": self.location,
+            "hl": self.language,
+        }
+        if self.date_range:
+            payload["tbs"] = self.date_range
+        return self._post(f"{SERPER_SEARCH_URL}/{endpoint}", payload)
+
+    def search_web(self, query: str, num_results: Optional[int] = None) -> str:
+        """
+        Search Google for a query.
+
+        Args:
+            query: The search query
+            num_results: Number of results to return
+
+        Returns:
+            JSON string with the search results
+        """
+        return self._search("search", query, num_results)
+
+    def search_news(self, query: str, num_results: Optional[int] = None) -> str:
+        """
+        Search Google News for recent articles on a query.
+
+        Args:
+            query: The news search query (e.g. 'Reliance Industries results')
+            num_results: Number of results to return
+
+        Returns:
+            JSON string with the news results
+        """
+        return self._search("news", query, num_results)
+
+    def search_scholar(self, query: str, num_results: Optional[int] = None) -> str:
+        """
+        Search Google Scholar for academic papers on a query.
+
+        Args:
+            query: The scholar search query
+            num_results: Number of results to return
+
+        Returns:
+            JSON string with the scholar results
+        """
+        return self._search("scholar", query, num_results)
+
+    def scrape_webpage(self, url: str, markdown: bool = False) -> str:
+        """
+        Scrape the content of a webpage.
+
+        Args:
+            url: URL of the webpage to scrape
+            markdown: Return the content as markdown
+
+        Returns:
+            JSON string with the page content
+        """
+        return self._post(
+            SERPER_SCRAPE_URL, {"url": url, "includeMarkdown": markdown}
+        )
@@ -0,0 +1,113 @@
+"""
+Persistent on-disk cache for Serper responses.
+
+Identical searches (e.g. the same ticker's news) are issued across many
+sessions; serving them from disk within a TTL saves both the round trip
+and the API credit.
+"""
+
+import functools
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+SERPER_CACHE_DIR = Path("tmp/serper_cache")
+
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Process-wide cache counters, for observability
+cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+# When stale entries were last swept from SERPER_CACHE_DIR
+_last_prune = 0.0
+
+
+def _parse_ttl(ttl: str) -> float:
+    """Convert a TTL like '30m', '1h' or '2d' to seconds."""
+    try:
+        return float(ttl[:-1]) * _TTL_UNITS[ttl[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(f"Invalid TTL '{ttl}', expected e.g. '30m', '1h', '1d'")
+
+
+def _cache_path(url: str, payload: Dict[str, Any]) -> Path:
+    key = json.dumps({"url": url, **payload}, sort_keys=True)
+    return SERPER_CACHE_DIR / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+
+def _read(path: Path, ttl_seconds: float) -> str | None:
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _prune(ttl_seconds: float) -> None:
+    """Delete cache entries older than the TTL, at most once per TTL period."""
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < ttl_seconds:
+        return
+    _last_prune = now
+
+    for path in SERPER_CACHE_DIR.glob("*.json"):
+        try:
+            if now - path.stat().st_mtime > ttl_seconds:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _write(path: Path, body: str, ttl_seconds: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(body, encoding="utf-8")
+    tmp_path.replace(path)
+    # Expired entries that are never requested again would otherwise pile up
+    _prune(ttl_seconds)
+
+
+def serper_cached(
+    ttl: str = "1h",
+) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """
+    Cache a `(self, url, payload) -> str` Serper fetch on disk.
+
+    Entries are keyed by the endpoint URL and full request payload (query,
+    location, language, result count, date range) and expire by file age.
+    Only successful responses reach the cache: the wrapped fetch must raise
+    on failure rather than return an error body.
+
+    Args:
+        ttl: Time-to-live such as '30m', '1h' or '1d'
+
+    Returns:
+        Decorator producing the caching wrapper
+    """
+    ttl_seconds = _parse_ttl(ttl)
+
+    def decorator(fn: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(fn)
+        def wrapper(self: Any, url: str, payload: Dict[str, Any]) -> str:
+            path = _cache_path(url, payload)
+            cached = _read(path, ttl_seconds)
+            if cached is not None:
+                cache_stats["hits"] += 1
+                return cached
+
+            cache_stats["misses"] += 1
+            body = fn(self, url, payload)
+            try:
+                _write(path, body, ttl_seconds)
+            except OSError:
+                pass  # Caching is best-effort
+            return body
+
+        return wrapper
+
+    return decorator
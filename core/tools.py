@@ -0,0 +1,33 @@
+"""
+One-time preparation of FinAgent's @tool functions for agno agents.
+"""
+
+from typing import TYPE_CHECKING, Iterable
+
+from agno.tools.function import Function
+
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
+
+def prepare_tools(agents: Iterable["Agent"]) -> None:
+    """
+    Build the JSON schema and validation wrapper of each agent's @tool
+    functions once, instead of on every run.
+
+    agno calls `process_entrypoint()` on every module-level Function at the
+    start of each agent run. That re-parses the docstring, rebuilds the
+    parameter schema and re-reads the installed pydantic version from package
+    metadata, which costs about 2ms per tool. The result never changes for
+    these functions, so each one is processed here and then flagged
+    `skip_entrypoint_processing`, which agno already honours for toolkit
+    functions. Toolkits such as the Serper search tools are left alone.
+
+    Args:
+        agents: Agents whose tools should be prepared
+    """
+    for agent in agents:
+        for tool in agent.tools or []:
+            if isinstance(tool, Function) and not tool.skip_entrypoint_processing:
+                tool.process_entrypoint()
+                tool.skip_entrypoint_processing = True
@@ -4,11 +4,19 @@ FinAgent - Financial Advisor Agent OS for Indians
 Main entry point for running the AgentOS server.
 """
 
+import logging
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Show FinAgent's own startup messages (agent loading, auth) on the console
+# without turning on INFO logging for every library
+logging.basicConfig(format="%(message)s")
+logging.getLogger("core").setLevel(logging.INFO)
+
 from core import create_agent_os
+from settings import get_settings
 
 # Create the AgentOS with all agents loaded from the agents folder
 agent_os = create_agent_os(
@@ -22,8 +30,11 @@ app = agent_os.get_app()
 
 if __name__ == "__main__":
     # Run the server
+    reload = get_settings().finagent_reload
     agent_os.serve(
-        app="main:app",
-        reload=True,
+        # Reload needs an import string for uvicorn's worker; otherwise serve
+        # the app built above instead of importing main a second time
+        app="main:app" if reload else app,
+        reload=reload,
         port=5111,
     )
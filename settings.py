@@ -18,12 +18,20 @@ class Settings(BaseSettings):
     client_app_id: str = Field(default="", description="Client application ID")
     profile_id: str = Field(default="", description="Profile ID for authentication")
 
+    # Server (set FINAGENT_RELOAD=1 for hot-reloading during development)
+    finagent_reload: bool = Field(
+        default=False, description="Restart the AgentOS server on code changes"
+    )
+
     # Pydantic v2 uses model_config instead of inner Config class
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "case_sensitive": False,
         "extra": "ignore",
+        # get_settings() shares one instance process-wide, so make it read-only
+        # (this also makes it hashable)
+        "frozen": True,
     }
 
 
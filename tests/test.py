@@ -1,47 +1,51 @@
-from agno.models.openai import OpenAILike
-from agno.agent import Agent
 import uuid
 import requests
 from dotenv import load_dotenv
-import os
-from agno.os import AgentOS
+from pathlib import Path
+import sys
+import threading
+import time
 
 # Load environment variables from .env file
 load_dotenv()
 
-from pydantic_settings import BaseSettings
-from pydantic import Field
+# Reuse the app's Settings model and cached accessor from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from settings import get_settings
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables"""
-
-    client_app_secret: str = Field(
-        ..., description="Client application secret for authentication"
-    )
-    experience_id: str = Field(..., description="Intuit experience ID")
-    client_app_id: str = Field(..., description="Client application ID")
-    profile_id: str = Field(..., description="Profile ID for authentication")
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+settings = get_settings()
 
+# Keep-alive session for IAM calls
+_session = requests.Session()
+_session.headers["Content-Type"] = "application/json"
 
-# Initialize settings
-settings = Settings()
+# IAM tokens are refreshed a minute before this age
+AUTH_TOKEN_TTL_SECONDS = 3600
 
+_token_lock = threading.Lock()
 _cached_token = None
+_token_expires_at = 0.0
 
 
 def _get_auth_token() -> str:
-    global _cached_token
-    if _cached_token:
+    """
+    Get cached authentication token or fetch a new one if missing or expired.
+
+    The lock makes concurrent callers share one IAM fetch: the first caller
+    fetches while the rest wait and then reuse its token.
+    """
+    global _cached_token, _token_expires_at
+
+    with _token_lock:
+        if _cached_token is None or time.monotonic() >= _token_expires_at:
+            _cached_token = _fetch_auth_token()
+            _token_expires_at = time.monotonic() + AUTH_TOKEN_TTL_SECONDS - 60
         return _cached_token
 
-    """Get cached authentication token or fetch a new one if not available"""
 
+def _fetch_auth_token() -> str:
+    """Fetch a new authentication token from IAM."""
     # Fetch new token from IAM
     url = "https://identityinternal.api.intuit.com/v1/graphql"
 
@@ -54,7 +58,6 @@ def _get_auth_token() -> str:
     headers = {
         "intuit_tid": str(uuid.uuid4()),
         "Authorization": f"Intuit_IAM_Authentication intuit_appid={settings.client_app_id}, intuit_app_secret={settings.client_app_secret}",
-        "Content-Type": "application/json",
     }
 
     data = {
@@ -63,44 +66,62 @@ def _get_auth_token() -> str:
     }
 
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = _session.post(url, json=data, headers=headers, timeout=10)
         response.raise_for_status()
         result = response.json()
 
         base_token = result["data"]["identitySignInInternalApplicationWithPrivateAuth"][
             "authorizationHeader"
         ]
-        _cached_token = f"{base_token},intuit_appid={settings.client_app_id},intuit_app_secret={settings.client_app_secret}"
+        token = f"{base_token},intuit_appid={settings.client_app_id},intuit_app_secret={settings.client_app_secret}"
         print("✓ New auth token obtained and cached")
-        return _cached_token
+        return token
     except Exception as e:
         print(f"✗ Failed to get auth token: {e}")
         raise
 
 
-llm = OpenAILike(
-    base_url="https://llmexecution.api.intuit.com/v3/lt/amazon.nova-lite-v1-0",
-    extra_headers={
-        "intuit_experience_id": settings.experience_id,
-        "intuit_originating_assetalias": "Intuit.coe.pecomplianceremediation",
-        "Authorization": _get_auth_token(),
-    },
-)
+def create_agent_os():
+    """
+    Build the smoke-test AgentOS with a single generalist agent.
+
+    agno is imported here and the IAM token fetched here, so importing this
+    module (e.g. during test collection) has no network or agent-setup cost.
+    """
+    from agno.agent import Agent
+    from agno.models.openai import OpenAILike
+    from agno.os import AgentOS
+
+    llm = OpenAILike(
+        base_url="https://llmexecution.api.intuit.com/v3/lt/amazon.nova-lite-v1-0",
+        extra_headers={
+            "intuit_experience_id": settings.experience_id,
+            "intuit_originating_assetalias": "Intuit.coe.pecomplianceremediation",
+            "Authorization": _get_auth_token(),
+        },
+    )
+
+    gen_agent = Agent(
+        name="Generalist",
+        instructions="You are a generalist agent that can help with a wide range of tasks.",
+        model=llm,
+    )
 
-gen_agent = Agent(
-    name="Generalist",
-    instructions="You are a generalist agent that can help with a wide range of tasks.",
-    model=llm,
-)
+    return AgentOS(
+        id="my-first-os",
+        description="My first AgentOS",
+        agents=[gen_agent],
+    )
 
-agent_os = AgentOS(
-    id="my-first-os",
-    description="My first AgentOS",
-    agents=[gen_agent],
-)
 
-app = agent_os.get_app()
+def create_app():
+    """App factory for uvicorn (served with factory=True)."""
+    return create_agent_os().get_app()
+
 
 if __name__ == "__main__":
-    # Default port is 7777; change with port=...
-    agent_os.serve(app="test:app", reload=True, port=5111)
+    import uvicorn
+
+    # The reload worker builds the AgentOS through create_app, so none is
+    # built (and no IAM token fetched) in this parent process
+    uvicorn.run("test:create_app", factory=True, reload=True, port=5111)